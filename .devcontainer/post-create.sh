@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+# Runs once when the Codespace is created
+
+# Restore the pip wheel cache and MUSCLE5 download published by the
+# Codespaces Setup workflow; carry on without it if it isn't available
+gh run download -n cache-latest -D "$HOME/.cache" >/dev/null 2>&1 || true
+
+python install_requirements.py --verify || python install_requirements.py
+python setup_muscle.py
+
+# Byte-compile the project now so the first launch skips compiling every module
+python -m compileall -q -j 0 . >/dev/null 2>&1 || true
@@ -1,6 +1,9 @@
 import os
+import io
 import sys
+import functools
 import subprocess
+import shutil
 import tempfile
 import multiprocessing
 import psutil
@@ -13,7 +16,11 @@ from Bio import SeqIO, AlignIO
 from Bio.Align import MultipleSeqAlignment
 from datetime import datetime
 import re
+import hashlib
 import platform
+import threading
+from collections import OrderedDict, deque
+from utils.muscle_path import run_muscle_setup, validate_muscle_executable
 
 # Import our compatibility utilities if available
 try:
@@ -39,6 +46,9 @@ except ImportError:
             return False
         return True
 
+# Environment variables don't change while we run, so detect Codespaces once
+IS_CODESPACES = is_codespaces()
+
 # Check Python compatibility and warn if needed
 if not is_compatible_python_version():
     print("\n" + "!" * 80)
@@ -81,18 +91,49 @@ def get_default_muscle_path():
 
 # Read from configuration file first
 config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "muscle_config.txt")
-if os.path.exists(config_path):
+
+# Last seen ((mtime_ns, size), path) of the configuration file
+_config_cache = (None, None)
+
+def _load_muscle_config():
+    """
+    Return the MUSCLE5 path stored in the configuration file
+    
+    The file is only re-read when its modification time or size changes.
+    
+    Returns:
+        The configured path, or None if the file is missing or unreadable
+    """
+    global _config_cache
     try:
-        with open(config_path, "r") as f:
-            muscle_path = f.read().strip()
-            if os.path.exists(muscle_path):
-                MUSCLE5_PATH = muscle_path
-            else:
-                MUSCLE5_PATH = os.environ.get("MUSCLE5_PATH", get_default_muscle_path())
-    except:
-        MUSCLE5_PATH = os.environ.get("MUSCLE5_PATH", get_default_muscle_path())
-else:
-    MUSCLE5_PATH = os.environ.get("MUSCLE5_PATH", get_default_muscle_path())
+        st = os.stat(config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != _config_cache[0]:
+            with open(config_path, "r") as f:
+                _config_cache = (stamp, f.read().strip())
+        return _config_cache[1]
+    except (OSError, ValueError):
+        return None
+
+def _save_muscle_config(muscle_path):
+    """Write the MUSCLE5 path to the configuration file and refresh the cache"""
+    global _config_cache
+    with open(config_path, "w") as f:
+        f.write(muscle_path)
+    st = os.stat(config_path)
+    _config_cache = ((st.st_mtime_ns, st.st_size), muscle_path)
+
+@functools.lru_cache(maxsize=None)
+def _resolve_muscle_path():
+    """Resolve the MUSCLE5 path from the config file, then the environment, then the OS default"""
+    muscle_path = _load_muscle_config()
+    if muscle_path and os.path.exists(muscle_path):
+        return muscle_path
+    
+    # Only probe the default locations if the environment doesn't name a path
+    return os.environ.get("MUSCLE5_PATH") or get_default_muscle_path()
+
+MUSCLE5_PATH = _resolve_muscle_path()
 
 # Create a global variable to store the path that can be updated from the UI
 current_muscle_path = MUSCLE5_PATH
@@ -103,30 +144,23 @@ def check_and_setup_muscle():
     global MUSCLE5_PATH, current_muscle_path
     
     is_valid, _ = validate_muscle_executable(current_muscle_path)
-    if not is_valid:
-        print("MUSCLE5 executable not found or invalid. Attempting auto-setup...")
-        try:
-            setup_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "setup_muscle.py")
-            if os.path.exists(setup_script):
-                subprocess.run([sys.executable, setup_script], check=True)
-                
-                # Reload path from config after setup
-                if os.path.exists(config_path):
-                    with open(config_path, "r") as f:
-                        muscle_path = f.read().strip()
-                        if os.path.exists(muscle_path):
-                            MUSCLE5_PATH = muscle_path
-                            current_muscle_path = muscle_path
-                            return True
-            return False
-        except Exception as e:
-            print(f"Auto-setup failed: {str(e)}")
-            return False
+    if is_valid:
+        return True
+    
+    muscle_path = run_muscle_setup()
+    if muscle_path is None:
+        return False
+    MUSCLE5_PATH = muscle_path
+    current_muscle_path = muscle_path
+    _resolve_muscle_path.cache_clear()
     return True
 
-def validate_muscle_executable(executable_path):
+# Leading bytes of ELF, PE and Mach-O executables, and of wrapper scripts
+EXECUTABLE_MAGIC = (b"\x7fELF", b"MZ", b"\xcf\xfa\xed\xfe", b"\xce\xfa\xed\xfe", b"\xca\xfe\xba\xbe", b"#!")
+
+def validate_muscle_quick(executable_path):
     """
-    Validates that the provided path is a valid MUSCLE5 executable
+    Cheaply check that a path looks like an executable without running it
     
     Args:
         executable_path: Path to the potential MUSCLE5 executable
@@ -134,30 +168,22 @@ def validate_muscle_executable(executable_path):
     Returns:
         Tuple of (is_valid, message)
     """
-    if not os.path.exists(executable_path):
+    if not os.path.isfile(executable_path):
         return False, f"File does not exist: {executable_path}"
     
     if not os.access(executable_path, os.X_OK) and not executable_path.endswith('.exe'):
         return False, f"File is not executable: {executable_path}"
     
     try:
-        # Try running with -version to see if it's actually MUSCLE
-        process = subprocess.run(
-            [executable_path, "-version"], 
-            capture_output=True, 
-            text=True,
-            check=False,
-            timeout=3  # Add a timeout to avoid hanging
-        )
-        
-        # Check for common MUSCLE version strings in output
-        if "MUSCLE" in process.stdout or "muscle" in process.stdout or "MUSCLE" in process.stderr or "muscle" in process.stderr:
-            return True, f"Valid MUSCLE executable detected: {os.path.basename(executable_path)}"
-        else:
-            return False, f"File does not appear to be a MUSCLE executable: {executable_path}"
-    
-    except Exception as e:
+        with open(executable_path, "rb") as f:
+            head = f.read(4)
+    except OSError as e:
         return False, f"Error validating executable: {str(e)}"
+    
+    if not head.startswith(EXECUTABLE_MAGIC):
+        return False, f"File does not appear to be an executable: {executable_path}"
+    
+    return True, f"Executable found: {os.path.basename(executable_path)}"
 
 # Function to update the muscle path when selected from UI
 def update_muscle_path(file):
@@ -178,10 +204,11 @@ def update_muscle_path(file):
     if is_valid:
         current_muscle_path = normalized_path
         MUSCLE5_PATH = normalized_path
+        _probe_muscle.cache_clear()
+        _resolve_muscle_path.cache_clear()
         # Save the path to a configuration file for future use
         try:
-            with open(os.path.join(os.path.dirname(__file__), "muscle_config.txt"), "w") as f:
-                f.write(normalized_path)
+            _save_muscle_config(normalized_path)
         except Exception:
             # Silently handle config file writing errors - not critical
             pass
@@ -195,14 +222,16 @@ def get_max_memory_gb():
     # Return 90% of available memory in GB
     return int(mem.total * 0.9 / (1024 * 1024 * 1024))
 
-def check_muscle5():
-    """Check if muscle5 is available and return the path"""
-    if os.path.exists(MUSCLE5_PATH):
+@functools.lru_cache(maxsize=None)
+def _probe_muscle(path_key):
+    """Probe the MUSCLE5 command for a (path, mtime) key and return it, or None"""
+    muscle_path, mtime = path_key
+    if mtime is not None:
         try:
-            subprocess.run([MUSCLE5_PATH, "-version"], 
+            subprocess.run([muscle_path, "-version"], 
                           check=False, capture_output=True)
-            print(f"Using Muscle5 at: {MUSCLE5_PATH}")
-            return MUSCLE5_PATH
+            print(f"Using Muscle5 at: {muscle_path}")
+            return muscle_path
         except Exception:
             pass
     
@@ -214,6 +243,50 @@ def check_muscle5():
     except Exception:
         return None
 
+def check_muscle5():
+    """Check if muscle5 is available and return the path"""
+    try:
+        mtime = os.path.getmtime(MUSCLE5_PATH)
+    except OSError:
+        mtime = None
+    muscle_cmd = _probe_muscle((MUSCLE5_PATH, mtime))
+    if muscle_cmd is None:
+        # Don't remember a miss, so installing MUSCLE later takes effect
+        _probe_muscle.cache_clear()
+    return muscle_cmd
+
+# Number of trailing stderr lines kept from a MUSCLE run (its progress log can be long)
+MUSCLE_LOG_LINES = 200
+
+def run_muscle_command(cmd):
+    """
+    Run a MUSCLE command without buffering its whole progress log in memory
+    
+    stdout is spooled to a temporary file and only the last MUSCLE_LOG_LINES
+    lines of stderr are kept.
+    
+    Args:
+        cmd: Command line as a list of arguments
+    
+    Returns:
+        Tuple of (stdout text, tail of stderr text)
+    
+    Raises:
+        subprocess.CalledProcessError: If MUSCLE exits with a non-zero status
+    """
+    with tempfile.TemporaryFile() as stdout_file:
+        process = subprocess.Popen(cmd, stdout=stdout_file, stderr=subprocess.PIPE, text=True)
+        with process.stderr:
+            stderr_tail = deque(process.stderr, maxlen=MUSCLE_LOG_LINES)
+        returncode = process.wait()
+        stdout_file.seek(0)
+        stdout = stdout_file.read().decode(errors="replace")
+    
+    stderr = "".join(stderr_tail)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd, output=stdout, stderr=stderr)
+    return stdout, stderr
+
 def run_muscle5_alignment(fasta_file, use_stratified=False, use_super5=False):
     """
     Runs Muscle5 alignment with maximum CPU and RAM usage
@@ -224,113 +297,172 @@ def run_muscle5_alignment(fasta_file, use_stratified=False, use_super5=False):
         use_super5: Whether to use super5 for large datasets
     
     Returns:
-        Path to the alignment result file and alignment result as string
+        Tuple of (path to the alignment result file, parsed MultipleSeqAlignment
+        or None if it could not be parsed, alignment result as string)
     """
     # Get the maximum available CPU cores
     max_threads = multiprocessing.cpu_count()
     
-    # Create temporary file for output
-    fd, output_file = tempfile.mkstemp(suffix=".afa")
+    # Stratified ensembles are only available for the standard -align mode
+    stratified = use_stratified and not use_super5
+    
+    # Create temporary file for output (ensembles use the .efa extension)
+    fd, output_file = tempfile.mkstemp(suffix=".efa" if stratified else ".afa")
     os.close(fd)
     
     try:
         # Check if muscle5 is available
         muscle_cmd = check_muscle5()
         if not muscle_cmd:
-            return None, (
+            return None, None, (
                 "Error: Muscle5 not found. Please download it from https://drive5.com/muscle/ "
                 "and update the MUSCLE5_PATH variable in the code with the correct path."
             )
         
-        # FIXED: Using the exact syntax from the help documentation
-        if use_super5:
-            # Command syntax from help: muscle -super5 seqs.fa -output aln.afa
-            cmd = [
-                muscle_cmd,
-                "-super5", fasta_file,  # Correct syntax based on help
-                "-output", output_file,
-                "-threads", str(max_threads)
-            ]
-        else:
-            # Command syntax from help: muscle -align seqs.fa -output aln.afa
-            cmd = [
-                muscle_cmd,
-                "-align", fasta_file,  # Correct syntax based on help
-                "-output", output_file,
-                "-threads", str(max_threads)
-            ]
-            
-            # Add stratified option if selected
-            if use_stratified:
-                cmd.append("-stratified")  # Changed to append to match help docs
-                # Change output file extension for ensembles
-                output_file = output_file.replace(".afa", ".efa")
-                # Update the output path in the command
-                cmd[4] = output_file  # Index is now 4 due to append
+        # Command syntax from help: muscle -align|-super5 seqs.fa -output aln.afa
+        mode_flag = "-super5" if use_super5 else "-align"
+        cmd = [
+            muscle_cmd,
+            mode_flag, fasta_file,
+            "-output", output_file,
+            "-threads", str(max_threads)
+        ]
+        if stratified:
+            cmd.append("-stratified")
         
         # Print the command for debugging
         cmd_str = " ".join(cmd)
         print(f"Running command: {cmd_str}")
         
         # Run muscle5
-        process = subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        muscle_stdout, muscle_stderr = run_muscle_command(cmd)
         
         # If using stratified, calculate dispersion
         dispersion_result = ""
-        if use_stratified and os.path.exists(output_file):
+        if stratified and os.path.exists(output_file):
             try:
                 disperse_cmd = [
                     muscle_cmd,
                     "-disperse", output_file
                 ]
-                disperse_process = subprocess.run(
-                    disperse_cmd,
-                    check=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                dispersion_result = "\n\nEnsemble Dispersion Analysis:\n" + disperse_process.stdout
+                disperse_stdout, _ = run_muscle_command(disperse_cmd)
+                dispersion_result = "\n\nEnsemble Dispersion Analysis:\n" + disperse_stdout
             except Exception as e:
                 dispersion_result = f"\n\nError calculating dispersion: {str(e)}"
         
-        # Read the alignment output and return as string
+        # Parse the alignment output once; the text shown in the UI is derived from it
         alignment_result = ""
-        if os.path.exists(output_file):
+        alignment = None
+        try:
+            alignment = AlignIO.read(output_file, "fasta")
+            alignment_result = format(alignment, "fasta")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Ensemble (.efa) output is not a single FASTA alignment, show it as-is
             with open(output_file, "r") as f:
                 alignment_result = f.read()
         
         # Print stats from muscle5
-        print(f"Muscle5 stdout: {process.stdout}")
-        print(f"Muscle5 stderr: {process.stderr}")
+        print(f"Muscle5 stdout: {muscle_stdout}")
+        print(f"Muscle5 stderr: {muscle_stderr}")
         
         # Add any stdout messages from Muscle5
-        if process.stdout:
-            alignment_result = process.stdout + "\n\n" + alignment_result
+        if muscle_stdout:
+            alignment_result = muscle_stdout + "\n\n" + alignment_result
         
         # Add dispersion results if available
         if dispersion_result:
             alignment_result += dispersion_result
             
-        return output_file, alignment_result
+        return output_file, alignment, alignment_result
     
     except subprocess.CalledProcessError as e:
-        return None, f"Error running Muscle5: {e.stderr if e.stderr else str(e)}"
+        return None, None, f"Error running Muscle5: {e.stderr if e.stderr else str(e)}"
     except Exception as e:
-        return None, f"Error: {str(e)}"
+        return None, None, f"Error: {str(e)}"
+
+# Lookup table mapping ASCII codes to one bit per unambiguous nucleotide
+NUCLEOTIDE_BITS = np.zeros(256, dtype=np.uint8)
+NUCLEOTIDE_BITS[np.frombuffer(b"ACGT", dtype=np.uint8)] = [1, 2, 4, 8]
+
+# Number of distinct nucleotides encoded in a 4-bit column mask
+POPCOUNT_4BIT = np.array([bin(i).count("1") for i in range(16)], dtype=np.uint8)
+
+def encode_alignment(alignment):
+    """
+    Encode the alignment as a 2D uint8 NumPy array (one row per sequence)
+    
+    The matrix is cached on the alignment object together with the Seq objects
+    it was built from, so later analysis and plotting steps can reuse it. Any
+    change to the records (append/extend or a replaced sequence) rebuilds it.
+    
+    Args:
+        alignment: MultipleSeqAlignment object
+    
+    Returns:
+        NumPy array of shape (num_seqs, aln_length) with ASCII byte codes
+    """
+    seqs = [record.seq for record in alignment]
+    cached = getattr(alignment, "_uint8_matrix", None)
+    if cached is not None:
+        cached_seqs, matrix = cached
+        if len(cached_seqs) == len(seqs) and all(a is b for a, b in zip(cached_seqs, seqs)):
+            return matrix
+    
+    matrix = np.stack([np.frombuffer(bytes(seq), dtype=np.uint8) for seq in seqs])
+    alignment._uint8_matrix = (tuple(seqs), matrix)
+    return matrix
+
+# Alignments with more cells than this are scanned with the Numba kernel when available
+NUMBA_SCAN_THRESHOLD = 1000000
 
-def identify_variations(alignment):
+@functools.lru_cache(maxsize=None)
+def _get_numba_scan():
+    """
+    Build the parallel Numba column scanner on first use
+    
+    Numba is optional: it is only imported for very large alignments, and
+    None is returned if it is not installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def scan(matrix):
+        num_seqs, aln_length = matrix.shape
+        snp = np.zeros(aln_length, np.bool_)
+        conserved = np.zeros(aln_length, np.bool_)
+        for j in prange(aln_length):
+            first = matrix[0, j]
+            usable = True
+            differs = False
+            for i in range(num_seqs):
+                c = matrix[i, j]
+                # Gaps and anything other than A, C, G, T make the column unusable
+                if c != 65 and c != 67 and c != 71 and c != 84:
+                    usable = False
+                    break
+                if c != first:
+                    differs = True
+            if usable:
+                if differs:
+                    snp[j] = True
+                else:
+                    conserved[j] = True
+        return snp, conserved
+    
+    return scan
+
+def identify_variations(alignment, matrix=None):
     """
     Identify SNPs and conserved regions in the alignment
     
     Args:
         alignment: MultipleSeqAlignment object
+        matrix: Optional byte matrix of the alignment from encode_alignment
     
     Returns:
         Tuple of (SNP positions, conserved positions)
@@ -338,35 +470,47 @@ def identify_variations(alignment):
     if not alignment or len(alignment) <= 1:
         return [], []
     
-    # Get alignment length
-    aln_length = alignment.get_alignment_length()
+    # Work on the whole alignment at once as a (sequences x columns) byte matrix
+    if matrix is None:
+        matrix = encode_alignment(alignment)
     
-    # Initialize lists to track SNPs and conserved positions
-    snp_positions = []
-    conserved_positions = []
+    # Very wide alignments are scanned column-parallel with Numba if installed
+    if matrix.size > NUMBA_SCAN_THRESHOLD:
+        scan = _get_numba_scan()
+        if scan is not None:
+            snp_mask, conserved_mask = scan(matrix)
+            return np.flatnonzero(snp_mask).tolist(), np.flatnonzero(conserved_mask).tolist()
     
-    # Check each column
-    for i in range(aln_length):
-        # Get all characters in this column
-        column = [record.seq[i] for record in alignment]
-        
-        # Skip columns with any gaps (conserved regions should have no gaps)
-        if '-' in column:
-            continue
-        
-        # Skip columns with ambiguous nucleotides like N
-        if any(base not in 'ACGT' for base in column):
-            continue
-        
-        # If all characters are the same (conserved)
-        if len(set(column)) == 1:
-            conserved_positions.append(i)
-        
-        # If there is variation among characters, it's a SNP
-        elif len(set(column)) > 1:
-            snp_positions.append(i)
+    # Pack each nucleotide into its own bit (A=1, C=2, G=4, T=8); gaps and
+    # ambiguous nucleotides like N map to 0
+    mask = NUCLEOTIDE_BITS[matrix]
+    
+    # Columns with any gaps or ambiguous nucleotides are skipped
+    usable = (mask != 0).all(axis=0)
     
-    return snp_positions, conserved_positions
+    # OR the bits down each column: one bit set means every sequence has the
+    # same base (conserved), more than one means there is variation (SNP)
+    base_count = POPCOUNT_4BIT[np.bitwise_or.reduce(mask, axis=0)]
+    conserved_positions = np.flatnonzero(usable & (base_count == 1))
+    snp_positions = np.flatnonzero(usable & (base_count > 1))
+    
+    return snp_positions.tolist(), conserved_positions.tolist()
+
+def consecutive_runs(positions):
+    """
+    Split sorted positions into runs of consecutive values
+    
+    Args:
+        positions: Sorted, non-empty NumPy array of integer positions
+    
+    Returns:
+        Tuple of (run starts, run ends) as NumPy arrays, ends inclusive
+    """
+    # A new run starts wherever the next position is not adjacent to the previous one
+    breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = np.concatenate(([positions[0]], positions[breaks]))
+    ends = np.concatenate((positions[breaks - 1], [positions[-1]]))
+    return starts, ends
 
 def find_conserved_regions(alignment, conserved_positions):
     """
@@ -382,35 +526,16 @@ def find_conserved_regions(alignment, conserved_positions):
     if not conserved_positions:
         return []
     
-    conserved_regions = []
-    
     # Sort positions (should already be sorted, but just to be safe)
-    conserved_positions = sorted(conserved_positions)
+    starts, ends = consecutive_runs(np.sort(np.asarray(conserved_positions)))
+    lengths = ends - starts + 1
     
-    # Initialize the first region
-    start_pos = conserved_positions[0]
-    current_pos = start_pos
-    
-    # Find continuous regions
-    for i in range(1, len(conserved_positions)):
-        if conserved_positions[i] == current_pos + 1:
-            # Continue the current region
-            current_pos = conserved_positions[i]
-        else:
-            # End of a conserved region
-            region_length = current_pos - start_pos + 1
-            # Get the conserved sequence (from the first record, as all are identical in these positions)
-            seq = str(alignment[0].seq[start_pos:current_pos+1])
-            conserved_regions.append((start_pos, current_pos, region_length, seq))
-            
-            # Start a new region
-            start_pos = conserved_positions[i]
-            current_pos = start_pos
-    
-    # Don't forget the last region
-    region_length = current_pos - start_pos + 1
-    seq = str(alignment[0].seq[start_pos:current_pos+1])
-    conserved_regions.append((start_pos, current_pos, region_length, seq))
+    # Get the conserved sequence (from the first record, as all are identical in these positions)
+    first_seq = str(alignment[0].seq)
+    conserved_regions = [
+        (start, end, length, first_seq[start:end + 1])
+        for start, end, length in zip(starts.tolist(), ends.tolist(), lengths.tolist())
+    ]
     
     return conserved_regions
 
@@ -428,11 +553,11 @@ def create_conservation_table(conserved_regions):
     if not conserved_regions:
         return pd.DataFrame(columns=['Start', 'End', 'Length', 'Sequence'])
     
-    # Convert to DataFrame
-    df = pd.DataFrame(conserved_regions, columns=['Start', 'End', 'Length', 'Sequence'])
-    
-    # Sort by length (longest first)
-    df = df.sort_values('Length', ascending=False)
+    # Sort by length (longest first) before building the frame; a stable sort
+    # keeps regions of equal length in alignment order
+    lengths = np.fromiter((region[2] for region in conserved_regions), dtype=np.int64, count=len(conserved_regions))
+    order = np.argsort(-lengths, kind="stable")
+    df = pd.DataFrame([conserved_regions[i] for i in order], columns=['Start', 'End', 'Length', 'Sequence'])
     
     # Add position index starting from 1
     df['Start'] = df['Start'] + 1
@@ -446,19 +571,41 @@ def create_conservation_table(conserved_regions):
     
     return df
 
+# Most recently built (figure, table, alignment) results keyed by alignment digest
+_PLOT_CACHE = OrderedDict()
+PLOT_CACHE_SIZE = 8
+
+def alignment_digest(alignment):
+    """Return a BLAKE2 digest of the record IDs and sequences of an alignment"""
+    digest = hashlib.blake2b(digest_size=16)
+    for record in alignment:
+        digest.update(record.id.encode("utf-8", "replace") + b"\n")
+        digest.update(bytes(record.seq) + b"\n")
+    return digest.hexdigest()
+
 def create_alignment_plot(alignment_file):
     """
     Creates an interactive visualization of the DNA alignment with SNPs and conserved regions highlighted
     
     Args:
-        alignment_file: Path to the alignment file
+        alignment_file: Path to the alignment file, or an already parsed MultipleSeqAlignment
     
     Returns:
         Tuple of (Plotly figure object, conservation table DataFrame)
     """
     try:
-        # Read the alignment file
-        alignment = AlignIO.read(alignment_file, "fasta")
+        # Read the alignment file unless it has already been parsed
+        if isinstance(alignment_file, MultipleSeqAlignment):
+            alignment = alignment_file
+        else:
+            alignment = AlignIO.read(alignment_file, "fasta")
+        
+        # Reuse the analysis and figure if this alignment was plotted recently
+        cache_key = alignment_digest(alignment)
+        cached = _PLOT_CACHE.get(cache_key)
+        if cached is not None:
+            _PLOT_CACHE.move_to_end(cache_key)
+            return cached
         
         # Define colors for nucleotides
         color_map = {
@@ -471,7 +618,9 @@ def create_alignment_plot(alignment_file):
         }
         
         # Find SNPs and conserved positions
-        snp_positions, conserved_positions = identify_variations(alignment)
+        # Encode the sequences to raw bytes once for both the analysis and the plot
+        matrix = encode_alignment(alignment)
+        snp_positions, conserved_positions = identify_variations(alignment, matrix)
         
         # Find conserved regions
         conserved_regions = find_conserved_regions(alignment, conserved_positions)
@@ -495,56 +644,103 @@ def create_alignment_plot(alignment_file):
         else:
             seq_note = f"Number of sequences: {num_seqs}"
         
-        # For each sequence in the alignment
-        for i in range(display_seqs):
-            record = alignment[i]
-            seq_str = str(record.seq)
-            
-            # Convert sequence to colors
-            colors = [color_map.get(base, 'grey') for base in seq_str]
-            
-            # Create a scatter plot for this sequence
-            fig.add_trace(go.Scatter(
-                x=list(range(len(seq_str))),
-                y=[i] * len(seq_str),
-                mode='markers',
-                marker=dict(
-                    size=10,
-                    color=colors,
-                    line=dict(width=1, color='black')
-                ),
-                name=record.id[:15] + '...' if len(record.id) > 15 else record.id,
-                hovertext=[f"Position {j+1}: {seq_str[j]}" for j in range(len(seq_str))],
-                hoverinfo='text'
-            ))
+        # For very long alignments, plot one cell per block of positions
+        # (the most common base in the block) so the browser stays responsive
+        max_display_columns = 2000
+        block_size = max(1, -(-aln_length // max_display_columns))
+        if block_size > 1:
+            seq_note += f" (one cell per {block_size} positions)"
+        
+        # Map byte codes to palette indices (the last entry is for any other character)
+        palette = list(color_map.values()) + ['grey']
+        symbols = np.array(list(color_map) + ['?'])
+        code_lut = np.full(256, len(color_map), dtype=np.uint8)
+        code_lut[[ord(base) for base in color_map]] = np.arange(len(color_map))
+        codes = code_lut[matrix[:display_seqs]]
+        
+        starts = np.arange(0, aln_length, block_size)
+        if block_size > 1:
+            # Pad the last block with an out-of-palette code so it is never counted
+            padded = np.full((display_seqs, len(starts) * block_size), len(palette), dtype=np.uint8)
+            padded[:, :aln_length] = codes
+            blocks = padded.reshape(display_seqs, len(starts), block_size)
+            # Count one code at a time; comparing against every code at once
+            # would allocate a boolean array per palette entry
+            counts = np.stack([(blocks == code).sum(axis=2) for code in range(len(palette))], axis=2)
+            codes = counts.argmax(axis=2)
+            hovertemplate = "Block from position %{x}: mostly %{text}<extra></extra>"
+        else:
+            hovertemplate = "Position %{x}: %{text}<extra></extra>"
+        
+        # Draw every displayed sequence as one row of a single heatmap trace,
+        # using a discrete colorscale with one band per palette entry
+        n_colors = len(palette)
+        colorscale = []
+        for k, color in enumerate(palette):
+            colorscale.append([k / n_colors, color])
+            colorscale.append([(k + 1) / n_colors, color])
+        
+        # The x axis uses 1-based positions so the browser can format hover
+        # labels straight from the coordinates; only the base letter is sent
+        fig.add_trace(go.Heatmap(
+            z=codes,
+            x=starts + 1,
+            y=np.arange(display_seqs),
+            zmin=-0.5,
+            zmax=n_colors - 0.5,
+            colorscale=colorscale,
+            showscale=False,
+            xgap=1,
+            ygap=1,
+            text=symbols[codes],
+            hovertemplate=hovertemplate
+        ))
+        
+        shapes = []
         
-        # Highlight SNP positions
+        # Highlight SNP positions (whole blocks when positions are grouped),
+        # merging adjacent SNP blocks into one rectangle per run; rectangles
+        # follow the heatmap cells, which are centred on each block's first position
         if snp_positions:
-            for pos in snp_positions:
-                fig.add_shape(
+            snp_blocks = np.unique(np.asarray(snp_positions) // block_size)
+            run_starts, run_ends = consecutive_runs(snp_blocks)
+            for start, end in zip(run_starts.tolist(), run_ends.tolist()):
+                shapes.append(dict(
                     type="rect",
-                    x0=pos - 0.5,
-                    x1=pos + 0.5,
+                    x0=start * block_size + 1 - block_size / 2,
+                    x1=end * block_size + 1 + block_size / 2,
                     y0=-1,
                     y1=display_seqs,
                     fillcolor="rgba(255, 255, 0, 0.3)",  # Yellow with transparency
                     line=dict(width=0),
-                    layer="below"
-                )
+                    layer="above"  # Heatmap cells are opaque
+                ))
         
-        # Highlight conserved regions
+        # Highlight conserved regions, snapped to the same blocks as the
+        # heatmap cells and merged where they touch or overlap
         if conserved_regions:
-            for start, end, _, _ in conserved_regions:
-                fig.add_shape(
+            merged = []
+            for first, last in sorted((start // block_size, end // block_size)
+                                      for start, end, _, _ in conserved_regions):
+                if merged and first <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], last)
+                else:
+                    merged.append([first, last])
+            for first, last in merged:
+                shapes.append(dict(
                     type="rect",
-                    x0=start - 0.5,
-                    x1=end + 0.5,
+                    x0=first * block_size + 1 - block_size / 2,
+                    x1=last * block_size + 1 + block_size / 2,
                     y0=-1,
                     y1=display_seqs,
                     fillcolor="rgba(0, 255, 0, 0.15)",  # Light green with transparency
                     line=dict(width=1, color="green"),
-                    layer="below"
-                )
+                    layer="above"  # Heatmap cells are opaque
+                ))
+        
+        # Assign all highlights in one layout update; add_shape per rectangle
+        # re-validates the whole shape list and becomes quadratic
+        fig.update_layout(shapes=shapes)
         
         # Add annotations
         annotations = [
@@ -606,7 +802,7 @@ def create_alignment_plot(alignment_file):
             )
         
         # Default visible range (first 100 positions)
-        default_range = [0, min(100, aln_length-1)]
+        default_range = [1, min(100, aln_length)]
         
         # Update layout with range slider for navigation
         fig.update_layout(
@@ -627,8 +823,8 @@ def create_alignment_plot(alignment_file):
             ),
             yaxis=dict(
                 tickvals=list(range(display_seqs)),
-                ticktext=[alignment[i].id[:15] + '...' if len(alignment[i].id) > 15 else alignment[i].id 
-                          for i in range(display_seqs)]
+                ticktext=[record_id[:15] + '...' if len(record_id) > 15 else record_id
+                          for record_id in (record.id for record in alignment[:display_seqs])]
             ),
             showlegend=False,
             margin=dict(l=150, r=20, t=100, b=100),
@@ -648,14 +844,18 @@ def create_alignment_plot(alignment_file):
                         dict(
                             label="Zoom Out",
                             method="relayout",
-                            args=[{"xaxis.range": [0, aln_length-1]}]
+                            args=[{"xaxis.range": [1, aln_length]}]
                         ),
                     ]
                 )
             ]
         )
         
-        return fig, conservation_table, alignment
+        result = (fig, conservation_table, alignment)
+        _PLOT_CACHE[cache_key] = result
+        if len(_PLOT_CACHE) > PLOT_CACHE_SIZE:
+            _PLOT_CACHE.popitem(last=False)
+        return result
     
     except Exception as e:
         # Create an error figure
@@ -697,19 +897,28 @@ def process_fasta(file, use_stratified, use_super5):
         temp_fasta = tempfile.NamedTemporaryFile(delete=False, suffix=".fasta")
         temp_fasta.close()
         
-        with open(file.name, "rb") as f_in, open(temp_fasta.name, "wb") as f_out:
-            f_out.write(f_in.read())
+        # Stream the copy (zero-copy where the platform supports it) instead of
+        # loading the whole upload into memory
+        shutil.copyfile(file.name, temp_fasta.name)
         
         # Check if the file is a valid FASTA file
         try:
-            records = list(SeqIO.parse(temp_fasta.name, "fasta"))
-            if not records:
+            # Gather statistics in a single streaming pass without keeping the records
+            seq_count = 0
+            total_length = 0
+            max_length = 0
+            for record in SeqIO.parse(temp_fasta.name, "fasta"):
+                seq_length = len(record.seq)
+                seq_count += 1
+                total_length += seq_length
+                if seq_length > max_length:
+                    max_length = seq_length
+            
+            if not seq_count:
                 return "The uploaded file does not contain valid FASTA sequences.", None, None, None
             
             # Print statistics about the FASTA file
-            seq_count = len(records)
-            avg_length = sum(len(record.seq) for record in records) / seq_count
-            max_length = max(len(record.seq) for record in records)
+            avg_length = total_length / seq_count
             
             stats = f"File contains {seq_count} sequences.\n"
             stats += f"Average length: {avg_length:.1f} bases.\n"
@@ -720,7 +929,7 @@ def process_fasta(file, use_stratified, use_super5):
                 stats += "NOTE: This is a large dataset. Super5 method is recommended.\n\n"
             
             # Run the alignment with the selected options
-            output_file, result = run_muscle5_alignment(
+            output_file, parsed_alignment, result = run_muscle5_alignment(
                 temp_fasta.name, 
                 use_stratified=use_stratified,
                 use_super5=use_super5
@@ -730,8 +939,8 @@ def process_fasta(file, use_stratified, use_super5):
             fig = None
             table = None
             alignment = None
-            if output_file and os.path.exists(output_file):
-                fig, table, alignment = create_alignment_plot(output_file)
+            if parsed_alignment is not None:
+                fig, table, alignment = create_alignment_plot(parsed_alignment)
             
             # Return statistics, result, visualization, conservation table, and alignment
             return stats + result, fig, table, alignment
@@ -742,18 +951,16 @@ def process_fasta(file, use_stratified, use_super5):
     except Exception as e:
         return f"Error processing file: {str(e)}", None, None, None
     finally:
-        # Cleanup
-        if temp_fasta and os.path.exists(temp_fasta.name):
+        # Cleanup (the output file is kept as we need it for visualization)
+        if temp_fasta:
             try:
                 os.remove(temp_fasta.name)
-            except:
-                pass
-        if output_file and os.path.exists(output_file):
-            try:
-                pass  # Don't delete the output file as we need it for visualization
-            except:
+            except OSError:
                 pass
 
+_EXPORT_CACHE = OrderedDict()
+EXPORT_CACHE_SIZE = 16
+
 def export_sequences(alignment, format_type, region=None):
     """
     Export sequences in various formats
@@ -769,11 +976,15 @@ def export_sequences(alignment, format_type, region=None):
     if alignment is None:
         return "No alignment available for export"
     
-    # Create a temporary file to use AlignIO for format conversion
-    fd, temp_file = tempfile.mkstemp(suffix=f".{format_type}")
-    os.close(fd)
-    
     try:
+        # Re-exporting the same alignment, format and region is common when
+        # toggling options, so reuse earlier serializations
+        cache_key = (alignment_digest(alignment), format_type, tuple(region) if region else None)
+        cached = _EXPORT_CACHE.get(cache_key)
+        if cached is not None:
+            _EXPORT_CACHE.move_to_end(cache_key)
+            return cached
+        
         # If region is specified, slice the alignment
         if region and len(region) == 2:
             start, end = region
@@ -784,25 +995,92 @@ def export_sequences(alignment, format_type, region=None):
         else:
             subalignment = alignment
         
-        # Write to the specified format
-        AlignIO.write(subalignment, temp_file, format_type)
+        # Write to the specified format straight into memory
+        buffer = io.StringIO()
+        AlignIO.write(subalignment, buffer, format_type)
         
-        # Read back the formatted content
-        with open(temp_file, 'r') as f:
-            content = f.read()
-        
-        return content
+        result = buffer.getvalue()
+        _EXPORT_CACHE[cache_key] = result
+        if len(_EXPORT_CACHE) > EXPORT_CACHE_SIZE:
+            _EXPORT_CACHE.popitem(last=False)
+        return result
     
     except Exception as e:
         return f"Error exporting sequences: {str(e)}"
-    
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+
+# Static Markdown shown in the interface
+MD_MUSCLE_HELP = """
+MUSCLE5 is required for alignment. Select the executable for your operating system:
+- [Download MUSCLE5](https://drive5.com/muscle/)
+- [View Setup Guide](MUSCLE5_SETUP.md)
+"""
+
+MD_ALIGNMENT_OPTIONS = """
+## Alignment Options:
+- **Standard Alignment**: Default alignment using the PPP algorithm
+- **Stratified Ensemble**: Creates multiple alignments to evaluate quality
+- **Super5**: Use for very large datasets (>1000 sequences)
+
+## Current Date/Time: {current_time}
+## Author: {current_user}
+### Contact:
+- Email: taherakbarisaeed@gmail.com
+- GitHub: tayden1990
+- Telegram: https://t.me/tayden2023
+
+If you use this tool in your research, please cite:
+```
+Saeed, T. A. (2023). Muscle5 Sequence Alignment Tool: A Python interface for 
+MUSCLE5 with visualization and conservation analysis.
+```
+"""
+
+MD_VIZ_LEGEND = """
+### Visualization Legend:
+- **Colors**: A=green, C=blue, G=orange, T=red, gaps=grey
+- **Yellow highlights**: SNP positions (columns with variation)
+- **Green highlights**: Conserved regions (identical across all sequences)
+- Use the range slider at the bottom to navigate through the sequence
+- Click and drag to zoom into specific regions
+"""
+
+MD_CONSERVATION_INTRO = """
+### Conserved Regions Analysis
+This table shows continuous regions where all sequences have identical nucleotides.
+A region is only considered conserved if:
+1. All sequences have the exact same nucleotide (A, C, G, or T) at each position
+2. No gaps are present in any sequence
+3. No ambiguous nucleotides (like N) are present
+"""
+
+MD_CONSERVATION_COLUMNS = """
+- **Start**: Starting position of the conserved region
+- **End**: Ending position of the conserved region
+- **Length**: Number of nucleotides in the conserved region
+- **Sequence**: The actual conserved sequence
+
+Regions are sorted by length (longest first) to highlight the most significant conserved areas.
+"""
+
+MD_CODESPACES_NOTE = """
+**You're running in GitHub Codespaces!**
+
+- Session will timeout after 30 minutes of inactivity
+- For large datasets, consider downloading and running locally
+- Use the share button to get a temporary public URL
+"""
+
+_CACHED_APP = None
 
 # Create Gradio interface
 def create_ui():
+    """Return the Gradio interface, building it on first use only"""
+    global _CACHED_APP
+    if _CACHED_APP is None:
+        _CACHED_APP = _build_ui()
+    return _CACHED_APP
+
+def _build_ui():
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Use actual time
     current_user = "Taher Akbari Saeed"  # Updated to real name
     
@@ -810,7 +1088,7 @@ def create_ui():
         gr.Markdown("# Muscle5 Sequence Alignment Tool")
         gr.Markdown("Upload a FASTA file to align sequences using Muscle5.")
         
-        # Store the alignment as a state variable
+        # Store the alignment and its length as a state variable
         alignment_state = gr.State(None)
         
         with gr.Row():
@@ -838,16 +1116,22 @@ def create_ui():
                 with gr.Group():
                     gr.Markdown("### MUSCLE5 Executable Configuration")
                     
-                    # Check if the current path is valid and display appropriate status
-                    is_valid, message = validate_muscle_executable(current_muscle_path)
+                    # Only do the cheap file checks while building the UI; the full
+                    # -version probe runs in the background and fills the cache
+                    is_valid, message = validate_muscle_quick(current_muscle_path)
+                    deep_results = {}
+                    
+                    def run_deep_check(path):
+                        deep_results[path] = validate_muscle_executable(path)
+                    
+                    deep_check = threading.Thread(
+                        target=run_deep_check, args=(current_muscle_path,), daemon=True
+                    )
+                    deep_check.start()
                     initial_status = f"{'✅ Ready to run' if is_valid else '❌ MUSCLE5 not properly configured'}"
                     initial_color = "green" if is_valid else "red"
                     
-                    gr.Markdown("""
-                    MUSCLE5 is required for alignment. Select the executable for your operating system:
-                    - [Download MUSCLE5](https://drive5.com/muscle/)
-                    - [View Setup Guide](MUSCLE5_SETUP.md)
-                    """)
+                    gr.Markdown(MD_MUSCLE_HELP)
                     
                     # Show colored status message
                     muscle_path_status = gr.Markdown(
@@ -876,28 +1160,25 @@ def create_ui():
                         outputs=[muscle_path_status]
                     )
                     
+                    # Replace the quick status with the full validation once the page loads
+                    def refresh_muscle_status():
+                        deep_check.join()
+                        # Reuse the background result so a failing binary isn't re-run on
+                        # every page load; only a path chosen since then is validated
+                        path = current_muscle_path
+                        if path not in deep_results:
+                            deep_results[path] = validate_muscle_executable(path)
+                        is_valid, _ = deep_results[path]
+                        status = '✅ Ready to run' if is_valid else '❌ MUSCLE5 not properly configured'
+                        color = "green" if is_valid else "red"
+                        return f"<span style='color: {color};'>{status}</span>"
+                    
+                    app.load(fn=refresh_muscle_status, outputs=[muscle_path_status])
+                    
                     # Remove the update_displayed_path function and the muscle_path_text component
                     # that were previously here
                 
-                gr.Markdown(f"""
-                ## Alignment Options:
-                - **Standard Alignment**: Default alignment using the PPP algorithm
-                - **Stratified Ensemble**: Creates multiple alignments to evaluate quality
-                - **Super5**: Use for very large datasets (>1000 sequences)
-                
-                ## Current Date/Time: {current_time}
-                ## Author: {current_user}
-                ### Contact:
-                - Email: taherakbarisaeed@gmail.com
-                - GitHub: tayden1990
-                - Telegram: https://t.me/tayden2023
-                
-                If you use this tool in your research, please cite:
-                ```
-                Saeed, T. A. (2023). Muscle5 Sequence Alignment Tool: A Python interface for 
-                MUSCLE5 with visualization and conservation analysis.
-                ```
-                """)
+                gr.Markdown(MD_ALIGNMENT_OPTIONS.format(current_time=current_time, current_user=current_user))
             
             with gr.Column(scale=2):
                 # Add tabs for text results, visualization, and conservation table
@@ -907,33 +1188,12 @@ def create_ui():
                     
                     with gr.TabItem("DNA Visualization"):
                         plot_output = gr.Plot(label="DNA Alignment Visualization")
-                        gr.Markdown("""
-                        ### Visualization Legend:
-                        - **Colors**: A=green, C=blue, G=orange, T=red, gaps=grey
-                        - **Yellow highlights**: SNP positions (columns with variation)
-                        - **Green highlights**: Conserved regions (identical across all sequences)
-                        - Use the range slider at the bottom to navigate through the sequence
-                        - Click and drag to zoom into specific regions
-                        """)
+                        gr.Markdown(MD_VIZ_LEGEND)
                     
                     with gr.TabItem("Conservation Analysis"):
-                        gr.Markdown("""
-                        ### Conserved Regions Analysis
-                        This table shows continuous regions where all sequences have identical nucleotides.
-                        A region is only considered conserved if:
-                        1. All sequences have the exact same nucleotide (A, C, G, or T) at each position
-                        2. No gaps are present in any sequence
-                        3. No ambiguous nucleotides (like N) are present
-                        """)
+                        gr.Markdown(MD_CONSERVATION_INTRO)
                         conservation_table = gr.DataFrame(label="Conserved Regions")
-                        gr.Markdown("""
-                        - **Start**: Starting position of the conserved region
-                        - **End**: Ending position of the conserved region
-                        - **Length**: Number of nucleotides in the conserved region
-                        - **Sequence**: The actual conserved sequence
-                        
-                        Regions are sorted by length (longest first) to highlight the most significant conserved areas.
-                        """)
+                        gr.Markdown(MD_CONSERVATION_COLUMNS)
                     
                     with gr.TabItem("Export Options"):
                         gr.Markdown("### Export Sequences")
@@ -955,7 +1215,7 @@ def create_ui():
                             region_end = gr.Number(label="End Position", value=100, minimum=1, step=1)
                         
                         export_btn = gr.Button("Generate Export", variant="primary")
-                        export_result = gr.Textbox(label="Export Result", lines=15)
+                        export_result = gr.Textbox(label="Export Result", lines=15, elem_id="export_result_box")
                         copy_btn = gr.Button("Copy to Clipboard")
                         download_btn = gr.Button("Download as File")
                         
@@ -964,7 +1224,8 @@ def create_ui():
                             None,
                             js="""
                             function() {
-                                const text = document.querySelector("textarea[data-testid='textbox']").value;
+                                // Look up the export box by its elem_id, not the first textbox on the page
+                                const text = document.querySelector("#export_result_box textarea").value;
                                 navigator.clipboard.writeText(text);
                                 return text;
                             }
@@ -979,9 +1240,10 @@ def create_ui():
                         )
                         
                         # Function to export sequences
-                        def export_handler(alignment, format_type, use_region, start, end):
-                            if alignment is None:
+                        def export_handler(state, format_type, use_region, start, end):
+                            if state is None:
                                 return "Please run an alignment first."
+                            alignment, _ = state
                             
                             if use_region:
                                 region = (int(start), int(end))
@@ -997,21 +1259,20 @@ def create_ui():
                         )
                         
                         # Function to update region end value based on alignment length
-                        def update_region_end(alignment):
-                            if alignment is None:
+                        def update_region_end(state):
+                            if state is None:
                                 return 100
-                            return alignment.get_alignment_length()
+                            return state[1]
                         
                         # Download handler
                         def download_handler(text, format_type):
                             if not text or text == "Please run an alignment first.":
                                 return None
                                 
-                            # Create a temporary file with the content
+                            # Gradio 3.x file outputs need a path, so write the content
+                            # once through the descriptor mkstemp already opened
                             fd, temp_file = tempfile.mkstemp(suffix=f".{format_type}")
-                            os.close(fd)
-                            
-                            with open(temp_file, 'w') as f:
+                            with os.fdopen(fd, 'w') as f:
                                 f.write(text)
                                 
                             return temp_file
@@ -1026,10 +1287,15 @@ def create_ui():
         def process_and_store(file, use_stratified, use_super5):
             result, fig, table, alignment = process_fasta(file, use_stratified, use_super5)
             
-            # Update region end value if alignment is available
-            end_val = alignment.get_alignment_length() if alignment else 100
+            # Measure the alignment once and keep the length next to it
+            if alignment is not None:
+                end_val = alignment.get_alignment_length()
+                state = (alignment, end_val)
+            else:
+                end_val = 100
+                state = None
             
-            return result, fig, table, alignment, gr.Number(value=end_val, minimum=1, step=1)
+            return result, fig, table, state, gr.Number(value=end_val, minimum=1, step=1)
         
         submit_btn.click(
             fn=process_and_store, 
@@ -1038,18 +1304,12 @@ def create_ui():
         )
         
     # Add Codespaces info box if running in Codespaces
-    if is_codespaces():
+    if IS_CODESPACES:
         with gr.Blocks() as app:
             with gr.Row():
                 with gr.Column(scale=1):
                     gr.Markdown("### 🌩️ GitHub Codespaces Environment")
-                    gr.Markdown("""
-                    **You're running in GitHub Codespaces!**
-                    
-                    - Session will timeout after 30 minutes of inactivity
-                    - For large datasets, consider downloading and running locally
-                    - Use the share button to get a temporary public URL
-                    """)
+                    gr.Markdown(MD_CODESPACES_NOTE)
                 with gr.Column(scale=3):
                     # Insert main interface components
                     pass
@@ -1068,10 +1328,11 @@ def create_app():
     app = create_ui()
     return app
 
-# If this script is run directly (not imported), launch the app normally
-if __name__ == "__main__":
-    demo = create_app()
-    demo.launch()
+def _print_share(result):
+    """Print the public sharing URL returned by launch(), if there is one"""
+    url = getattr(result, 'share_url', None)
+    if url:
+        print(f"\n{'=' * 60}\n🌎 PUBLIC SHARING URL: {url}\n{'=' * 60}\n")
 
 if __name__ == "__main__":
     # Run MUSCLE5 setup check
@@ -1085,27 +1346,17 @@ if __name__ == "__main__":
         launch_app(app)
     except ImportError:
         # Fall back to the original code if compatibility module isn't available
-        codespaces_env = is_codespaces()
+        codespaces_env = IS_CODESPACES
         if codespaces_env:
-            # GitHub Codespaces requires public=True and needs the host to be 0.0.0.0
+            # GitHub Codespaces needs the host to be 0.0.0.0; it forwards the
+            # port itself, so no gradio.live share tunnel is needed
             print(f"Running in GitHub Codespaces environment")
             try:
-                result = app.launch(server_name="0.0.0.0", share=True, prevent_thread_lock=True)
-                if hasattr(result, 'share_url') and result.share_url:
-                    print("\n" + "=" * 60)
-                    print(f"🌎 PUBLIC SHARING URL: {result.share_url}")
-                    print("=" * 60 + "\n")
+                result = app.launch(server_name="0.0.0.0", share=False, prevent_thread_lock=True)
             except TypeError:
                 # Fallback for older Gradio versions or if there's a parameter issue
-                result = app.launch(server_name="0.0.0.0", share=True)
-                if hasattr(result, 'share_url') and result.share_url:
-                    print("\n" + "=" * 60)
-                    print(f"🌎 PUBLIC SHARING URL: {result.share_url}")
-                    print("=" * 60 + "\n")
+                result = app.launch(server_name="0.0.0.0", share=False)
         else:
             # Standard local launch
             result = app.launch(share=True)
-            if hasattr(result, 'share_url') and result.share_url:
-                print("\n" + "=" * 60)
-                print(f"🌎 PUBLIC SHARING URL: {result.share_url}")
-                print("=" * 60 + "\n")
\ No newline at end of file
+            _print_share(result)
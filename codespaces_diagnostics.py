@@ -6,12 +6,17 @@ Run this script to verify your environment and identify potential problems.
 
 import os
 import sys
-import platform
 import subprocess
+import functools
 import importlib.util
+import importlib.metadata
 import json
 import socket
-from datetime import datetime
+import time
+from pathlib import Path
+from utils.platform_info import PY_VERSION, OS_NAME, OS_RELEASE, MACHINE
+from utils.console import clear_screen, flush_output
+from utils.compatibility import IS_CODESPACES
 
 def print_header(text):
     """Print a section header with formatting"""
@@ -19,44 +24,112 @@ def print_header(text):
     print(f" {text}")
     print("=" * 80)
 
-def is_codespaces():
-    """Check if running in GitHub Codespaces environment"""
-    return "CODESPACES" in os.environ or "CODESPACE_NAME" in os.environ or "MUSCLE5_CODESPACES_MODE" in os.environ
+# Environment variables that identify a GitHub Codespaces session
+RELEVANT_VARS = [
+    "CODESPACES", "CODESPACE_NAME", "GITHUB_CODESPACES", 
+    "CODESPACES_PORT", "GITHUB_USER", "GITHUB_SERVER_URL",
+    "MUSCLE5_CODESPACES_MODE"
+]
 
+# The environment doesn't change while we run, so read it once
+CODESPACES_ENV = {var: os.environ[var] for var in RELEVANT_VARS if var in os.environ}
+
+@functools.lru_cache(maxsize=4)
 def check_network_port(port=7860):
     """Check if the specified port is available or in use"""
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            # Match the web server, which binds with SO_REUSEADDR, so leftover
+            # TIME_WAIT connections don't count as "in use". On Windows the
+            # option would allow binding over a live listener, so skip it there.
+            if os.name != 'nt':
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             s.bind(("0.0.0.0", port))
             return True, None
     except socket.error as e:
         return False, str(e)
 
 def get_package_version(package_name):
-    """Get the version of an installed package"""
+    """Get the version of an installed distribution (by its PyPI name) without importing it"""
     try:
-        spec = importlib.util.find_spec(package_name)
-        if spec is None:
-            return None
-        
-        package = importlib.import_module(package_name)
-        return getattr(package, "__version__", "Unknown version")
-    except ImportError:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
         return None
 
+# Successful `-version` results, keyed by the binary's path, mtime and size
+VERSION_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "muscle5_version.json")
+
+def get_muscle_version(muscle_path):
+    """
+    Return the output of `muscle -version`, reusing a cached result when the
+    binary hasn't changed since the last run.
+    
+    Args:
+        muscle_path: Path to the MUSCLE5 executable
+        
+    Returns:
+        tuple: (version, error) - one of the two is None
+    """
+    if not os.access(muscle_path, os.X_OK):
+        return None, "not executable"
+    
+    st = os.stat(muscle_path)
+    key = f"{os.path.abspath(muscle_path)}|{st.st_mtime_ns}|{st.st_size}"
+    
+    try:
+        with open(VERSION_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    
+    if key in cache:
+        return cache[key], None
+    
+    result = subprocess.run([muscle_path, "-version"], capture_output=True, check=False, text=True, timeout=5)
+    if result.returncode != 0:
+        return None, f"Execution failed: {result.stderr.strip()}"
+    
+    version = result.stdout.strip()
+    cache[key] = version
+    try:
+        os.makedirs(os.path.dirname(VERSION_CACHE_FILE), exist_ok=True)
+        with open(VERSION_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # The cache is only an optimization
+    
+    return version, None
+
+# Last seen ((mtime_ns, size), path) of muscle_config.txt
+_MUSCLE_CFG_CACHE = (None, None)
+
+def load_muscle_cfg():
+    """
+    Return the MUSCLE5 path from muscle_config.txt, re-reading it only when
+    the file's modification time or size changes.
+    
+    Raises:
+        FileNotFoundError: If the config file doesn't exist
+    """
+    global _MUSCLE_CFG_CACHE
+    config = Path("muscle_config.txt")
+    st = config.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp != _MUSCLE_CFG_CACHE[0]:
+        _MUSCLE_CFG_CACHE = (stamp, config.read_text().strip())
+    return _MUSCLE_CFG_CACHE[1]
+
 def check_muscle5():
     """Check if MUSCLE5 is installed and accessible."""
     status = {"installed": False, "path": None, "version": None, "error": None}
     
     try:
-        # Check if config file exists
-        if not os.path.exists("muscle_config.txt"):
+        # Read the path from config file
+        try:
+            muscle_path = load_muscle_cfg()
+        except FileNotFoundError:
             status["error"] = "Config file not found"
             return status
-            
-        # Read the path from config file
-        with open("muscle_config.txt", "r") as f:
-            muscle_path = f.read().strip()
         
         status["path"] = muscle_path
         
@@ -76,12 +149,12 @@ def check_muscle5():
         else:
             # Check if it's runnable
             try:
-                result = subprocess.run([muscle_path, "-version"], capture_output=True, check=False, text=True)
-                if result.returncode == 0:
+                version, error = get_muscle_version(muscle_path)
+                if error is None:
                     status["installed"] = True
-                    status["version"] = result.stdout.strip()
+                    status["version"] = version
                 else:
-                    status["error"] = f"Execution failed: {result.stderr.strip()}"
+                    status["error"] = error
             except Exception as e:
                 status["error"] = str(e)
     except Exception as e:
@@ -91,18 +164,7 @@ def check_muscle5():
 
 def check_environment_variables():
     """Check for Codespaces environment variables"""
-    codespaces_vars = {}
-    relevant_vars = [
-        "CODESPACES", "CODESPACE_NAME", "GITHUB_CODESPACES", 
-        "CODESPACES_PORT", "GITHUB_USER", "GITHUB_SERVER_URL",
-        "MUSCLE5_CODESPACES_MODE"
-    ]
-    
-    for var in relevant_vars:
-        if var in os.environ:
-            codespaces_vars[var] = os.environ[var]
-    
-    return codespaces_vars
+    return dict(CODESPACES_ENV)
 
 def check_gradio():
     """Check Gradio installation and compatibility"""
@@ -137,8 +199,6 @@ def check_gradio():
 def print_diagnostic_result(title, result, success_indicator=None):
     """Print a diagnostic result with formatting"""
     if isinstance(result, dict):
-        print(f"\n{title}:")
-        
         # Determine status indicator
         if success_indicator is not None:
             status = success_indicator
@@ -148,59 +208,72 @@ def print_diagnostic_result(title, result, success_indicator=None):
             status = "❌"
         else:
             status = "⚠️"
-            
-        print(f"{status} ", end="")
         
-        # Print details
-        for key, value in result.items():
-            if value is not None and key != "installed":
-                print(f"{key}: {value}")
+        # Collect the details and write the whole result at once
+        details = [f"{key}: {value}" for key, value in result.items()
+                   if value is not None and key != "installed"]
+        print(f"\n{title}:\n{status} " + "\n".join(details))
     else:
         print(f"\n{title}: {result}")
 
-def print_env_var_instructions():
-    """Print platform-specific instructions for setting environment variables"""
-    system = platform.system()
-    print("\nTo simulate Codespaces environment locally:")
+def env_var_instructions():
+    """Return platform-specific instructions for setting environment variables as lines"""
+    system = OS_NAME
+    lines = ["\nTo simulate Codespaces environment locally:"]
     
     if system == "Windows":
-        print("\nIn Command Prompt:")
-        print("   set MUSCLE5_CODESPACES_MODE=1")
-        print("\nIn PowerShell:")
-        print("   $env:MUSCLE5_CODESPACES_MODE = 1")
-        print("\nTo set permanently in PowerShell:")
-        print("   [Environment]::SetEnvironmentVariable('MUSCLE5_CODESPACES_MODE', '1', 'User')")
+        lines += [
+            "\nIn Command Prompt:",
+            "   set MUSCLE5_CODESPACES_MODE=1",
+            "\nIn PowerShell:",
+            "   $env:MUSCLE5_CODESPACES_MODE = 1",
+            "\nTo set permanently in PowerShell:",
+            "   [Environment]::SetEnvironmentVariable('MUSCLE5_CODESPACES_MODE', '1', 'User')",
+        ]
     elif system == "Darwin":  # macOS
-        print("\nIn Terminal (bash/zsh):")
-        print("   export MUSCLE5_CODESPACES_MODE=1")
-        print("\nTo set permanently, add to ~/.zshrc or ~/.bash_profile:")
-        print("   echo 'export MUSCLE5_CODESPACES_MODE=1' >> ~/.zshrc")
+        lines += [
+            "\nIn Terminal (bash/zsh):",
+            "   export MUSCLE5_CODESPACES_MODE=1",
+            "\nTo set permanently, add to ~/.zshrc or ~/.bash_profile:",
+            "   echo 'export MUSCLE5_CODESPACES_MODE=1' >> ~/.zshrc",
+        ]
     else:  # Linux and others
-        print("\nIn Terminal (bash):")
-        print("   export MUSCLE5_CODESPACES_MODE=1")
-        print("\nTo set permanently, add to ~/.bashrc:")
-        print("   echo 'export MUSCLE5_CODESPACES_MODE=1' >> ~/.bashrc")
+        lines += [
+            "\nIn Terminal (bash):",
+            "   export MUSCLE5_CODESPACES_MODE=1",
+            "\nTo set permanently, add to ~/.bashrc:",
+            "   echo 'export MUSCLE5_CODESPACES_MODE=1' >> ~/.bashrc",
+        ]
     
-    print("\nAfter setting the environment variable, restart your terminal or run:")
+    lines.append("\nAfter setting the environment variable, restart your terminal or run:")
     if system == "Windows":
-        print("   python codespaces_diagnostics.py")
+        lines.append("   python codespaces_diagnostics.py")
     else:
-        print("   python3 codespaces_diagnostics.py")
+        lines.append("   python3 codespaces_diagnostics.py")
+    return lines
+
+def print_env_var_instructions():
+    """Print platform-specific instructions for setting environment variables"""
+    print("\n".join(env_var_instructions()))
 
 def run_diagnostics():
     """Run all diagnostics and print results"""
     # Clear screen
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
+    flush_output()
+    
+    # Port availability is cached per run; start each run fresh
+    check_network_port.cache_clear()
     
     print_header("MUSCLE5 CODESPACES DIAGNOSTICS")
     
     # Basic information
-    print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Python: {platform.python_version()}")
-    print(f"System: {platform.system()} {platform.release()} {platform.machine()}")
+    print(f"\nTimestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Python: {PY_VERSION}")
+    print(f"System: {OS_NAME} {OS_RELEASE} {MACHINE}")
     
     # Check if running in Codespaces
-    in_codespaces = is_codespaces()
+    in_codespaces = IS_CODESPACES
     print_diagnostic_result("Running in GitHub Codespaces", 
                            "Yes" if in_codespaces else "No", 
                            "✅" if in_codespaces else "⚠️")
@@ -234,29 +307,42 @@ def run_diagnostics():
     # Provide troubleshooting advice
     print_header("TROUBLESHOOTING ADVICE")
     
+    # Collect the advice and write it in one go
+    advice = []
     if not in_codespaces:
-        print("\n⚠️ Not running in GitHub Codespaces environment")
-        print_env_var_instructions()
+        advice.append("\n⚠️ Not running in GitHub Codespaces environment")
+        advice += env_var_instructions()
     
     if not gradio_status["installed"] or not gradio_status["compatible"]:
-        print("\n❌ Gradio issues detected")
-        print("   - Install/update with: pip install -U gradio")
-        print("   - For Codespaces compatibility, use Gradio 3.x or 4.x")
+        advice += [
+            "\n❌ Gradio issues detected",
+            "   - Install/update with: pip install -U gradio",
+            "   - For Codespaces compatibility, use Gradio 3.x or 4.x",
+        ]
     
     if not muscle_status["installed"]:
-        print("\n❌ MUSCLE5 not properly installed or configured")
-        print("   - Run: python setup_muscle.py --force")
-        print("   - Check permissions: chmod +x <muscle_path>")
+        advice += [
+            "\n❌ MUSCLE5 not properly installed or configured",
+            "   - Run: python setup_muscle.py --force",
+            "   - Check permissions: chmod +x <muscle_path>",
+        ]
     
     if not port_available:
-        print("\n❌ Port 7860 is already in use")
-        if platform.system() == "Windows":
-            print("   - Find and stop the process: Get-Process -Id (Get-NetTCPConnection -LocalPort 7860).OwningProcess")
-            print("   - Alternative: Restart computer or use a different port")
+        advice.append("\n❌ Port 7860 is already in use")
+        if OS_NAME == "Windows":
+            advice += [
+                "   - Find and stop the process: Get-Process -Id (Get-NetTCPConnection -LocalPort 7860).OwningProcess",
+                "   - Alternative: Restart computer or use a different port",
+            ]
         else:
-            print("   - Stop other running instances: pkill -f 'python app.py'")
-            print("   - Find process using: lsof -i :7860")
-        print("   - Or modify the port number in app.py or codespaces_start.py")
+            advice += [
+                "   - Stop other running instances: pkill -f 'python app.py'",
+                "   - Find process using: lsof -i :7860",
+            ]
+        advice.append("   - Or modify the port number in app.py or codespaces_start.py")
+    
+    if advice:
+        print("\n".join(advice))
     
     # Full startup instructions
     print_header("STARTUP INSTRUCTIONS")
@@ -8,8 +8,8 @@ import os
 import sys
 import subprocess
 import time
-import platform
-from datetime import datetime
+from utils.platform_info import PY_VERSION, OS_NAME, OS_RELEASE
+from utils.process import exec_script
 
 def print_header():
     """Print a colorful header"""
@@ -22,13 +22,18 @@ def print_header():
         "red": "\033[91m"
     }
     
-    print(f"{colors['bold']}{colors['blue']}==============================================={colors['reset']}")
-    print(f"{colors['bold']}{colors['green']}    MUSCLE5 SEQUENCE ALIGNMENT TOOL - CODESPACES{colors['reset']}")
-    print(f"{colors['bold']}{colors['blue']}==============================================={colors['reset']}")
-    print(f"Python: {colors['yellow']}{platform.python_version()}{colors['reset']}")
-    print(f"OS: {colors['yellow']}{platform.system()} {platform.release()}{colors['reset']}")
-    print(f"Date: {colors['yellow']}{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{colors['reset']}")
-    print()
+    # Build the banner first and write it with a single call
+    buf = "\n".join([
+        f"{colors['bold']}{colors['blue']}==============================================={colors['reset']}",
+        f"{colors['bold']}{colors['green']}    MUSCLE5 SEQUENCE ALIGNMENT TOOL - CODESPACES{colors['reset']}",
+        f"{colors['bold']}{colors['blue']}==============================================={colors['reset']}",
+        f"Python: {colors['yellow']}{PY_VERSION}{colors['reset']}",
+        f"OS: {colors['yellow']}{OS_NAME} {OS_RELEASE}{colors['reset']}",
+        f"Date: {colors['yellow']}{time.strftime('%Y-%m-%d %H:%M:%S')}{colors['reset']}",
+        "",
+    ])
+    sys.stdout.write(buf + "\n")
+    sys.stdout.flush()
 
 def get_gradio_version():
     """Get the installed Gradio version"""
@@ -38,24 +43,56 @@ def get_gradio_version():
     except ImportError:
         return "not installed"
 
+# Touched with the mtime of requirements.txt after a successful check
+DEPS_SENTINEL = ".muscle5_deps_ok"
+
+def requirements_unchanged():
+    """Return True if the dependencies were verified since requirements.txt last changed"""
+    try:
+        return os.stat(DEPS_SENTINEL).st_mtime_ns == os.stat("requirements.txt").st_mtime_ns
+    except OSError:
+        return False
+
+def mark_requirements_ok():
+    """Record that the dependencies match the current requirements.txt"""
+    try:
+        st = os.stat("requirements.txt")
+        with open(DEPS_SENTINEL, "w"):
+            pass
+        os.utime(DEPS_SENTINEL, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
+        pass
+
 def check_requirements():
     """Check for required packages and compatibility"""
     print("Checking environment...")
     
-    # Check for Gradio
-    gradio_version = get_gradio_version()
-    print(f"- Gradio version: {gradio_version}")
-    
-    if gradio_version == "not installed":
-        print("  ❌ Gradio is not installed!")
-        print("  Installing required packages...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=False)
+    if requirements_unchanged():
+        print("- Requirements unchanged since the last successful check")
+    else:
+        # Check for Gradio
         gradio_version = get_gradio_version()
-        print(f"  - Installed Gradio version: {gradio_version}")
+        print(f"- Gradio version: {gradio_version}")
+        
+        if gradio_version == "not installed":
+            print("  ❌ Gradio is not installed!")
+            print("  Installing Gradio...")
+            subprocess.run([sys.executable, "-m", "pip", "install", "--quiet", "--disable-pip-version-check",
+                            "--no-input", "gradio>=3.40.1,<5.0.0"], check=False)
+            gradio_version = get_gradio_version()
+            
+            # Only resolve the full requirements if the targeted install didn't work
+            if gradio_version == "not installed":
+                print("  Installing required packages...")
+                subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=False)
+                gradio_version = get_gradio_version()
+            print(f"  - Installed Gradio version: {gradio_version}")
+        
+        if gradio_version != "not installed":
+            mark_requirements_ok()
     
-    # Check for MUSCLE5
-    import os
-    from app import check_and_setup_muscle
+    # Check for MUSCLE5 without importing the Gradio application
+    from utils.muscle_path import check_and_setup_muscle
     
     print("- Checking MUSCLE5 installation...")
     check_result = check_and_setup_muscle()
@@ -75,11 +112,11 @@ def run_application():
     if gradio_version.startswith("4."):
         print(f"Using launch method for Gradio 4.x (detected {gradio_version})")
         print("Command: python simple_app.py\n")
-        subprocess.run([sys.executable, "simple_app.py"])
+        exec_script("simple_app.py")
     else:
         print(f"Using launch method for Gradio 3.x (detected {gradio_version})")
         print("Command: python run_simple.py\n")
-        subprocess.run([sys.executable, "run_simple.py"])
+        exec_script("run_simple.py")
 
 def main():
     print_header()
@@ -5,65 +5,74 @@ This script displays a welcome message and instructions when a Codespace is crea
 """
 
 import os
-import platform
-import sys
-import subprocess
-from datetime import datetime
+import stat
+import functools
+from pathlib import Path
+from utils.console import colored, queue_output, print_colored, flush_output, clear_screen
 
-def print_colored(text, color):
-    """Print colored text to the terminal"""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m",
-        "reset": "\033[0m",
-        "bold": "\033[1m"
-    }
-    
-    print(f"{colors.get(color, '')}{text}{colors['reset']}")
+# ASCII Art banner
+BANNER = """
+    __  ___                __     ______     _____                                  
+   /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
+  / /|_/ / / / / ___/ _ \/ / _ \/___ \/ ___/\__ \/ _ \/ __ \/ / / / _ \\_  / / / / /
+ / /  / / /_/ (__  )  __/ /  __/___/ / /__ ___/ /  __/ / / / /_/ /  __// /_/ /_/ / 
+/_/  /_/\\__,_/____/\\___/_/\\___/_____/\\___//____/\\___/_/ /_/\\__, /\\___/___/\\__, /  
+                                                          /____/         /____/   
+    """
+# Check if this is a GitHub Codespaces environment
+IN_CODESPACES = "CODESPACES" in os.environ
+
+# The banner, welcome and closing text never change during a run, so render them once
+if IN_CODESPACES:
+    BANNER_BLOCK = (colored(BANNER, "cyan")
+                    + colored("🚀 WELCOME TO MUSCLE5 SEQUENCE ALIGNMENT TOOL 🚀", "green")
+                    + colored("Running in GitHub Codespaces environment\n", "green"))
+else:
+    BANNER_BLOCK = (colored(BANNER, "cyan")
+                    + colored("🚀 MUSCLE5 SEQUENCE ALIGNMENT TOOL 🚀", "blue")
+                    + colored("Running in local environment\n", "blue"))
+
+FOOTER_BLOCK = "".join([
+    # Startup instructions
+    colored("To start the application:", "yellow"),
+    colored("  Run: python app.py", "white"),
+    colored("  The web interface will be available at http://127.0.0.1:7860\n", "white"),
+    colored("For more information:", "blue"),
+    colored("  • View README.md for usage instructions", "white"),
+    colored("  • See GITHUB_CODESPACES.md for Codespaces-specific guidance", "white"),
+    colored("  • Visit https://github.com/tayden1990/bioinformatic-python-alignment-muscle5 for updates\n", "white"),
+    colored("Happy aligning! 🧬🔬✨\n", "green"),
+])
 
+@functools.lru_cache(maxsize=1)
 def check_muscle_installation():
-    """Check if MUSCLE5 is installed and configured"""
+    """Check if MUSCLE5 is installed and configured, using stat calls only"""
     config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "muscle_config.txt")
     
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            muscle_path = f.read().strip()
-            if os.path.exists(muscle_path):
-                return True, muscle_path
+    try:
+        muscle_path = Path(config_path).read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return False, None
     
+    try:
+        st = os.stat(muscle_path)
+    except OSError:
+        return False, None
+    
+    # A regular file with an executable bit is enough; no need to run it
+    if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+        return True, muscle_path
     return False, None
 
 def main():
     """Display setup notice and environment information"""
-    # Clear the terminal
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
-    # Check if this is a GitHub Codespaces environment
-    in_codespaces = "CODESPACES" in os.environ
+    import time
+    from utils.platform_info import PY_VERSION, OS_NAME, OS_RELEASE
     
-    # ASCII Art banner
-    banner = """
-    __  ___                __     ______     _____                                  
-   /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
-  / /|_/ / / / / ___/ _ \/ / _ \/___ \/ ___/\__ \/ _ \/ __ \/ / / / _ \\_  / / / / /
- / /  / / /_/ (__  )  __/ /  __/___/ / /__ ___/ /  __/ / / / /_/ /  __// /_/ /_/ / 
-/_/  /_/\\__,_/____/\\___/_/\\___/_____/\\___//____/\\___/_/ /_/\\__, /\\___/___/\\__, /  
-                                                          /____/         /____/   
-    """
-    
-    print_colored(banner, "cyan")
+    # Clear the terminal
+    clear_screen()
     
-    if in_codespaces:
-        print_colored("🚀 WELCOME TO MUSCLE5 SEQUENCE ALIGNMENT TOOL 🚀", "green")
-        print_colored("Running in GitHub Codespaces environment\n", "green")
-    else:
-        print_colored("🚀 MUSCLE5 SEQUENCE ALIGNMENT TOOL 🚀", "blue")
-        print_colored("Running in local environment\n", "blue")
+    queue_output(BANNER_BLOCK)
     
     # Check MUSCLE5 installation
     muscle_installed, muscle_path = check_muscle_installation()
@@ -77,21 +86,12 @@ def main():
     
     # Show system info
     print_colored("System Information:", "magenta")
-    print_colored(f"  • Python: {platform.python_version()}", "white")
-    print_colored(f"  • OS: {platform.system()} {platform.release()}", "white")
-    print_colored(f"  • Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n", "white")
-    
-    # Startup instructions
-    print_colored("To start the application:", "yellow")
-    print_colored("  Run: python app.py", "white")
-    print_colored("  The web interface will be available at http://127.0.0.1:7860\n", "white")
-    
-    print_colored("For more information:", "blue")
-    print_colored("  • View README.md for usage instructions", "white")
-    print_colored("  • See GITHUB_CODESPACES.md for Codespaces-specific guidance", "white")
-    print_colored("  • Visit https://github.com/tayden1990/bioinformatic-python-alignment-muscle5 for updates\n", "white")
+    print_colored(f"  • Python: {PY_VERSION}", "white")
+    print_colored(f"  • OS: {OS_NAME} {OS_RELEASE}", "white")
+    print_colored(f"  • Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n", "white")
     
-    print_colored("Happy aligning! 🧬🔬✨\n", "green")
+    queue_output(FOOTER_BLOCK)
+    flush_output()
 
 if __name__ == "__main__":
     main()
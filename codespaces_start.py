@@ -6,14 +6,9 @@ Handles compatibility with Gradio versions and Codespaces environment
 
 import os
 import sys
-import platform
-import datetime
-import subprocess
-import importlib.util
 
-def print_banner():
-    """Print a fancy ASCII banner for the application."""
-    banner = """
+# ASCII Art banner
+BANNER = """
     __  ___                __     ______     _____                                  
    /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
   / /|_/ / / / / ___/ _ \/ / _ \/___ \/ ___/\__ \/ _ \/ __ \/ / / / _ \\_  / / / / /
@@ -21,17 +16,28 @@ def print_banner():
 /_/  /_/\\__,_/____/\\___/_/\\___/_____/\\___//____/\\___/_/ /_/\\__, /\\___/___/\\__, /  
                                                           /____/         /____/   
     """
-    print(banner)
-    print("MUSCLE5 Sequence Alignment Tool - GitHub Codespaces Edition")
-    print(f"Starting application at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-" * 80)
-    print(f"System: {platform.system()} {platform.machine()}")
-    print(f"Python: {platform.python_version()}")
-    print("-" * 80)
-    print()
+def print_banner():
+    """Print a fancy ASCII banner for the application."""
+    import time
+    from utils.platform_info import PY_VERSION, OS_NAME, MACHINE
+    
+    # Assemble the banner and system details, then write them in one go
+    sys.stdout.write("\n".join([
+        BANNER,
+        "MUSCLE5 Sequence Alignment Tool - GitHub Codespaces Edition",
+        f"Starting application at {time.strftime('%Y-%m-%d %H:%M:%S')}",
+        "-" * 80,
+        f"System: {OS_NAME} {MACHINE}",
+        f"Python: {PY_VERSION}",
+        "-" * 80,
+        "",
+    ]) + "\n")
+    sys.stdout.flush()
 
 def check_muscle5():
     """Check if MUSCLE5 is installed and accessible."""
+    import shutil
+    
     print("Checking MUSCLE5 installation...")
     try:
         # Read the path from config file
@@ -44,37 +50,51 @@ def check_muscle5():
             print(f"   Path: {muscle_path}")
             print("   Attempting to find MUSCLE5 in PATH...")
             
-            # Try to find muscle5 in PATH
-            try:
-                subprocess.run(["muscle5", "-version"], capture_output=True, check=False)
+            # Look muscle5 up on PATH without running it
+            if shutil.which("muscle5"):
                 print("✅ Found MUSCLE5 in PATH")
                 # Update config file
                 with open("muscle_config.txt", "w") as f:
                     f.write("muscle5")
                 return True
-            except FileNotFoundError:
+            else:
                 print("❌ MUSCLE5 not found in PATH")
                 print("Please download MUSCLE5 and set the path in the application.")
                 return False
         else:
             # Check if it's runnable
-            try:
-                subprocess.run([muscle_path, "-version"], capture_output=True, check=False)
+            if os.access(muscle_path, os.X_OK):
                 print("✅ MUSCLE5 is ready to use")
                 return True
-            except Exception as e:
-                print(f"❌ Error running MUSCLE5: {str(e)}")
+            else:
+                print(f"❌ Error running MUSCLE5: {muscle_path} is not executable")
                 return False
     except Exception as e:
         print(f"❌ Error checking MUSCLE5: {str(e)}")
         return False
 
+def launch_gradio(major_version):
+    """Launch the application with Codespaces-compatible settings for the given Gradio major version"""
+    # Both major versions accept the same launch() arguments; only the message differs
+    print(f"Using launch method for Gradio {'4.x' if major_version >= 4 else '3.x'}")
+    from app import create_app
+    demo = create_app()
+    demo.launch(
+        server_name="0.0.0.0",  # Listen on all interfaces
+        server_port=7860,       # Use the default Gradio port
+        # Codespaces forwards the port itself, so skip the gradio.live tunnel there
+        share="CODESPACES" not in os.environ,
+        inbrowser=False,        # Don't try to open a browser
+        debug=False             # Disable debug mode for production
+    )
+
 def main():
     """Main function to start the application in Codespaces."""
     print_banner()
     check_muscle5()
     
     # Check Gradio version for compatibility
+    import importlib.util
     try:
         gradio_spec = importlib.util.find_spec("gradio")
         if gradio_spec:
@@ -86,32 +106,9 @@ def main():
             
             # Import and run the main application
             # Make sure we're using correct launch parameters for GitHub Codespaces
-            gradio_version = gr.__version__.split('.')
-            major_version = int(gradio_version[0])
-            
-            if major_version >= 4:
-                print("Using launch method for Gradio 4.x")
-                # Import main app module and run it with Codespaces-compatible settings
-                from app import create_app
-                demo = create_app()
-                demo.launch(
-                    server_name="0.0.0.0",  # Listen on all interfaces
-                    server_port=7860,       # Use the default Gradio port
-                    share=True,             # Enable public sharing
-                    inbrowser=False,        # Don't try to open a browser
-                    debug=False             # Disable debug mode for production
-                )
-            else:
-                print("Using launch method for Gradio 3.x")
-                # Import main app module and run it with Codespaces-compatible settings
-                import app
-                app.main(
-                    server_name="0.0.0.0",  # Listen on all interfaces
-                    server_port=7860,       # Use the default Gradio port
-                    share=True,             # Enable public sharing
-                    inbrowser=False,        # Don't try to open a browser
-                    debug=False             # Disable debug mode for production
-                )
+            # Version handles pre-release suffixes such as 4.0.0a1
+            from packaging.version import Version
+            launch_gradio(Version(gr.__version__).major)
         else:
             print("❌ Gradio not installed. Please install with: pip install gradio")
             sys.exit(1)
@@ -1,35 +1,63 @@
-from PIL import Image, ImageDraw, ImageFont
 import os
+import sys
+import numpy as np
 
-def create_app_icon():
+def icon_is_current():
+    """Return True if icon.png and icon.ico exist and are newer than this script"""
+    try:
+        script_mtime = os.stat(os.path.abspath(__file__)).st_mtime_ns
+        return all(os.stat(name).st_mtime_ns >= script_mtime for name in ('icon.png', 'icon.ico'))
+    except OSError:
+        return False
+
+def create_app_icon(force=False):
     """Create a simple icon for the application"""
-    # Create a 256x256 image with transparent background
-    img = Image.new('RGBA', (256, 256), color=(0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    # The icon only depends on the drawing code below, so reuse it when up to date
+    if not force and icon_is_current():
+        print(f"Icon is up to date: {os.path.abspath('icon.ico')}")
+        return os.path.abspath('icon.ico')
+    
+    # Pillow is only needed when an icon is actually generated
+    from PIL import Image, ImageDraw, ImageFont
+    
+    # Paint the symbol as a stack of layers and composite them with NumPy.
+    # Layer 0 is the circle background, then for each step its two
+    # horizontal lines followed by its connector, as they were drawn before.
+    y, x = np.ogrid[:256, :256]
+    steps = np.arange(5)
+    y_offset = 20 * steps
     
-    # Draw a circle background
-    draw.ellipse((16, 16, 240, 240), fill=(0, 100, 200, 255))
-    
-    # Draw a DNA-like symbol
-    for i in range(5):
-        # Calculate position
-        y_offset = 20 * i
-        
-        # Draw first horizontal line
-        draw.line((64, 84 + y_offset, 192, 84 + y_offset), 
-                 fill=(255, 255, 255, 255), width=8)
-        
-        # Draw second horizontal line
-        draw.line((64, 172 - y_offset, 192, 172 - y_offset), 
-                 fill=(255, 255, 255, 255), width=8)
-        
-        # Draw connectors between lines
+    masks = np.zeros((11, 256, 256), dtype=bool)
+    colors = np.zeros((12, 4), dtype=np.uint8)  # index 11 stays transparent
+    
+    # Circle background
+    masks[0] = (y - 128) ** 2 + (x - 128) ** 2 <= 112.5 ** 2
+    colors[0] = (0, 100, 200, 255)
+    
+    # Horizontal lines, 8 px thick, for all five steps at once
+    rail_rows = np.arange(-3, 5)
+    top = (84 + y_offset)[:, None] + rail_rows
+    bottom = (172 - y_offset)[:, None] + rail_rows
+    for layer, rows in zip(1 + 2 * steps, np.concatenate([top, bottom], axis=1)):
+        masks[layer, rows, 64:193] = True
+    colors[1 + 2 * steps] = (255, 255, 255, 255)
+    
+    # Connectors between lines; diagonal strokes are left to ImageDraw
+    for i in steps:
+        connector = Image.new('L', (256, 256), 0)
         if i % 2 == 0:
-            draw.line((80 + 30 * i, 84 + y_offset, 110 + 30 * i, 172 - y_offset), 
-                     fill=(0, 255, 0, 255), width=6)
+            ImageDraw.Draw(connector).line((80 + 30 * i, 84 + 20 * i, 110 + 30 * i, 172 - 20 * i), fill=255, width=6)
+            colors[2 + 2 * i] = (0, 255, 0, 255)
         else:
-            draw.line((80 + 30 * i, 172 - y_offset, 110 + 30 * i, 84 + y_offset), 
-                     fill=(255, 100, 0, 255), width=6)
+            ImageDraw.Draw(connector).line((80 + 30 * i, 172 - 20 * i, 110 + 30 * i, 84 + 20 * i), fill=255, width=6)
+            colors[2 + 2 * i] = (255, 100, 0, 255)
+        masks[2 + 2 * i] = np.asarray(connector) > 0
+    
+    # The topmost layer covering each pixel decides its color
+    covered = masks.any(axis=0)
+    topmost = len(masks) - 1 - np.argmax(masks[::-1], axis=0)
+    img = Image.fromarray(colors[np.where(covered, topmost, 11)], 'RGBA')
+    draw = ImageDraw.Draw(img)
     
     # Draw text "M5" for Muscle5
     try:
@@ -45,12 +73,18 @@ def create_app_icon():
     # Save as PNG and ICO
     img.save('icon.png')
     
-    # Convert to ICO format (for Windows)
+    # Convert to ICO format (for Windows). Each smaller size is resampled from
+    # the next larger one instead of from the 256x256 master every time.
     sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    img.save('icon.ico', sizes=sizes)
+    frames = []
+    frame = img
+    for size in sorted(sizes, reverse=True)[1:]:
+        frame = frame.resize(size, Image.LANCZOS)
+        frames.append(frame)
+    img.save('icon.ico', sizes=sizes, append_images=frames)
     
     print(f"Icon created: {os.path.abspath('icon.ico')}")
     return os.path.abspath('icon.ico')
 
 if __name__ == "__main__":
-    create_app_icon()
+    create_app_icon(force="--force" in sys.argv)
@@ -5,32 +5,32 @@ Script to install missing dependencies identified by codespaces_diagnostics.py
 
 import sys
 import subprocess
-import importlib.util
-import platform
-from datetime import datetime
+import re
+import importlib.metadata
+import time
+from utils.platform_info import PY_VERSION, OS_NAME, OS_RELEASE, MACHINE
+from utils.console import queue_output, print_colored, flush_output
 
-def print_colored(text, color):
-    """Print colored text to the terminal"""
-    colors = {
-        "reset": "\033[0m",
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m"
-    }
-    print(f"{colors.get(color, '')}{text}{colors['reset']}")
+def normalize_name(name):
+    """Normalize a distribution name the way pip compares them (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
 
-def check_package(package_name):
-    """Check if a package is installed"""
-    spec = importlib.util.find_spec(package_name)
-    return spec is not None
+def installed_distributions():
+    """Return the normalized names of all installed distributions, in one scan"""
+    return {normalize_name(dist.metadata["Name"]) for dist in importlib.metadata.distributions()
+            if dist.metadata["Name"]}
+
+def check_package(package_name, installed=None):
+    """Check if a package (by its PyPI name) is installed"""
+    if installed is None:
+        installed = installed_distributions()
+    return normalize_name(package_name) in installed
 
 def install_package(package_name):
     """Install a package using pip"""
     print_colored(f"Installing {package_name}...", "yellow")
+    # pip writes straight to the terminal, so show everything queued so far first
+    flush_output()
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
         return True
@@ -38,37 +38,49 @@ def install_package(package_name):
         print_colored(f"Error installing {package_name}: {e}", "red")
         return False
 
+def install_packages(package_names):
+    """
+    Install several packages with a single pip invocation
+    
+    Returns:
+        Tuple of (successfully installed, failed to install) package lists
+    """
+    print_colored(f"Installing {', '.join(package_names)}...", "yellow")
+    flush_output()
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *package_names])
+        return list(package_names), []
+    except subprocess.CalledProcessError:
+        # Retry one by one to find out which package is the problem
+        print_colored("Batch installation failed, retrying packages individually...", "yellow")
+        succeeded = [name for name in package_names if install_package(name)]
+        return succeeded, [name for name in package_names if name not in succeeded]
+
 def main():
     """Main function to install missing dependencies"""
     print_colored("\n=== MUSCLE5 MISSING DEPENDENCIES INSTALLER ===", "cyan")
-    print_colored(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "white")
-    print_colored(f"Python: {platform.python_version()}", "white")
-    print_colored(f"System: {platform.system()} {platform.release()} {platform.machine()}\n", "white")
+    print_colored(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}", "white")
+    print_colored(f"Python: {PY_VERSION}", "white")
+    print_colored(f"System: {OS_NAME} {OS_RELEASE} {MACHINE}\n", "white")
     
     # Define required packages
     missing_packages = []
     
-    # Check for missing packages
-    if not check_package("scipy"):
-        missing_packages.append("scipy")
-    if not check_package("biopython"):
-        missing_packages.append("biopython")
+    # Check for missing packages against a single scan of the installed distributions
+    installed = installed_distributions()
+    for package in ("scipy", "biopython"):
+        if not check_package(package, installed):
+            missing_packages.append(package)
     
     # Install missing packages
     if missing_packages:
         print_colored(f"Found {len(missing_packages)} missing dependencies: {', '.join(missing_packages)}", "yellow")
         print_colored("Starting installation...\n", "blue")
         
-        successfully_installed = []
-        failed_to_install = []
-        
-        for package in missing_packages:
-            if install_package(package):
-                successfully_installed.append(package)
-            else:
-                failed_to_install.append(package)
+        # One pip run resolves everything together instead of starting pip per package
+        successfully_installed, failed_to_install = install_packages(missing_packages)
         
-        print()
+        queue_output("\n")
         if successfully_installed:
             print_colored(f"✅ Successfully installed: {', '.join(successfully_installed)}", "green")
         if failed_to_install:
@@ -80,6 +92,7 @@ def main():
     print_colored("1. Run 'python codespaces_diagnostics.py' to verify all dependencies", "white")
     print_colored("2. Start the application with 'python codespaces_start.py'", "white")
     print_colored("\n==============================================\n", "cyan")
+    flush_output()
 
 if __name__ == "__main__":
     main()
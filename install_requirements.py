@@ -6,7 +6,10 @@ Requirements installer script that properly handles environment-specific depende
 import os
 import sys
 import subprocess
+import json
 import platform
+import importlib.util
+import importlib.metadata
 
 def is_codespaces():
     """Check if running in GitHub Codespaces environment"""
@@ -16,46 +19,109 @@ def get_python_version():
     """Returns Python version as a tuple (major, minor)"""
     return (sys.version_info.major, sys.version_info.minor)
 
+def get_installer_command():
+    """
+    Return the command prefix used to install packages
+    
+    uv resolves and downloads in parallel, so it is preferred over pip. It is
+    bootstrapped with pip when missing; pip is used if that fails.
+    """
+    if importlib.util.find_spec("uv") is None:
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--quiet", "uv"],
+            check=False
+        )
+        if result.returncode != 0:
+            return [sys.executable, "-m", "pip", "install", "--use-pep517"]
+    
+    # Target this interpreter explicitly so virtual environments are respected
+    return [sys.executable, "-m", "uv", "pip", "install", "--python", sys.executable]
+
+# Import names of the packages every environment needs
+REQUIRED_MODULES = ("gradio", "Bio", "plotly", "pandas", "numpy", "psutil",
+                    "PIL", "matplotlib", "requests", "packaging", "tqdm")
+
+def missing_modules():
+    """Return the required modules that can't be found, without importing any of them"""
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    
+    # Codespaces needs the pinned Gradio release, not just any version
+    if is_codespaces() and "gradio" not in missing:
+        try:
+            if importlib.metadata.version("gradio") != "3.50.2":
+                missing.append("gradio")
+        except importlib.metadata.PackageNotFoundError:
+            missing.append("gradio")
+    return missing
+
+def install_needed(pkgs):
+    """
+    Return True unless a pip dry run reports that the specs are already satisfied
+    
+    Older pip releases without --dry-run are treated as needing an install.
+    """
+    dry = subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--dry-run", "--quiet", "--disable-pip-version-check",
+         "--report", "-", *pkgs],
+        capture_output=True, text=True, check=False
+    )
+    if dry.returncode != 0:
+        return True
+    try:
+        # The JSON report lists every distribution pip would install
+        return bool(json.loads(dry.stdout).get("install"))
+    except ValueError:
+        return True
+
 def main():
     """Install requirements based on the current environment"""
-    print("Installing dependencies...")
+    # The devcontainer image already has the dependencies baked in, so
+    # only install when something is actually missing
+    missing = missing_modules()
+    if "--verify" in sys.argv:
+        if missing:
+            print(f"Missing modules: {', '.join(missing)}")
+            return 1
+        print("All required modules are installed.")
+        return 0
     
-    # Install base requirements
-    print("Installing base requirements...")
-    subprocess.run([
-        sys.executable, "-m", "pip", "install",
-        "gradio>=3.40.1,<5.0.0", "biopython>=1.81,<2.0.0",
+    # Codespaces uses a pinned Gradio; everything else gets the supported range
+    if is_codespaces():
+        gradio_spec = "gradio==3.50.2"
+    else:
+        gradio_spec = "gradio>=3.40.1,<5.0.0"
+    
+    # Every spec goes into one pip call so the resolver runs only once; the
+    # platform-specific packages are selected by their environment markers
+    pkgs = [
+        gradio_spec, "biopython>=1.81,<2.0.0",
         "plotly>=5.14.1,<6.0.0", "pandas>=2.0.0,<3.0.0", "numpy>=1.24.0,<2.0.0", "psutil>=5.9.0,<6.0.0",
         "Pillow>=9.0.0,<10.0.0", "matplotlib>=3.5.0,<4.0.0", "requests>=2.28.0,<3.0.0",
         "packaging>=21.0,<24.0", "tqdm>=4.64.0,<5.0.0",
-        "--no-cache-dir", "--upgrade"
-    ], check=True)
+        "pywin32>=305; sys_platform == 'win32'",
+        "pyobjc-framework-Cocoa>=9.0; sys_platform == 'darwin' and python_version >= '3.9'",
+    ]
     
-    # Install platform-specific packages
-    if sys.platform == "win32":
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", "pywin32>=305",
-            "--no-cache-dir", "--upgrade"
-        ], check=True)
-    elif sys.platform == "darwin":
-        # Only install PyObjC on macOS with Python 3.9 or higher
-        python_version = get_python_version()
-        if python_version >= (3, 9):
-            print("Installing macOS specific packages (PyObjC)...")
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", "pyobjc-framework-Cocoa>=9.0",
-                "--no-cache-dir", "--upgrade"
-            ], check=True)
-        else:
-            print(f"Skipping PyObjC installation: Python {python_version[0]}.{python_version[1]} detected, but PyObjC requires 3.9+")
+    # Every module is importable, but the versions may still be off; ask pip
+    # what it would do and skip the upgrade pass if the answer is nothing
+    if not missing and not install_needed(pkgs):
+        print("All requirements are already satisfied.")
+        return 0
     
-    # Install additional Codespaces-specific packages if needed
+    print("Installing dependencies...")
     if is_codespaces():
         print("Detected GitHub Codespaces environment, installing specific versions...")
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", "gradio==3.50.2", 
-            "--no-cache-dir", "--upgrade"
-        ], check=True)
+    
+    if sys.platform == "darwin" and get_python_version() < (3, 9):
+        python_version = get_python_version()
+        print(f"Skipping PyObjC installation: Python {python_version[0]}.{python_version[1]} detected, but PyObjC requires 3.9+")
+    
+    if is_codespaces():
+        os.environ.setdefault("UV_CONCURRENT_DOWNLOADS", "16")
+    
+    # The wheel cache is left enabled so a cache restored into ~/.cache is reused
+    installer = get_installer_command()
+    subprocess.run([*installer, *pkgs, "--upgrade"], check=True)
     
     print("Dependency installation completed successfully!")
     return 0
@@ -6,14 +6,16 @@ Works consistently in local environment and GitHub Codespaces
 
 import os
 import sys
-import platform
 import subprocess
 from datetime import datetime
 import importlib.util
+from pathlib import Path
 
-def print_banner():
-    """Print a welcome banner with basic info"""
-    banner = """
+from utils.platform_info import PY_VERSION, OS_NAME, MACHINE
+from utils.process import exec_script
+from utils.compatibility import IS_CODESPACES
+
+BANNER = """
     __  ___                __     ______     _____                                  
    /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
   / /|_/ / / / / ___/ _ \/ / _ \/___ \/ ___/\__ \/ _ \/ __ \/ / / / _ \\_  / / / / /
@@ -21,30 +23,28 @@ def print_banner():
 /_/  /_/\\__,_/____/\\___/_/\\___/_____/\\___//____/\\___/_/ /_/\\__, /\\___/___/\\__, /  
                                                           /____/         /____/   
     """
-    print(banner)
+
+def print_banner():
+    """Print a welcome banner with basic info"""
+    print(BANNER)
     print("MUSCLE5 Sequence Alignment Tool")
-    print(f"System: {platform.system()} {platform.machine()}")
-    print(f"Python: {platform.python_version()}")
+    print(f"System: {OS_NAME} {MACHINE}")
+    print(f"Python: {PY_VERSION}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 80)
 
-def is_codespaces():
-    """Check if running in GitHub Codespaces environment"""
-    return "CODESPACES" in os.environ or "CODESPACE_NAME" in os.environ
-
 def setup_muscle():
     """Set up MUSCLE5 executable if needed"""
     # Check if muscle_config.txt exists and has valid content
     muscle_path = None
     try:
-        if os.path.exists("muscle_config.txt"):
-            with open("muscle_config.txt", "r") as f:
-                muscle_path = f.read().strip()
-                
-            # Verify the path exists and is executable
-            if not os.path.exists(muscle_path):
-                muscle_path = None
-    except:
+        # Read the config once; a missing file simply means "not configured"
+        text = Path("muscle_config.txt").read_text().strip()
+        
+        # Verify the path exists
+        if text and os.path.exists(text):
+            muscle_path = text
+    except (OSError, ValueError):
         muscle_path = None
     
     # If not configured, run setup
@@ -65,7 +65,24 @@ def get_gradio_version():
     except ImportError:
         return None
 
-def start_application():
+def run_script(script, isolated=False):
+    """Run an application script as ``__main__``.
+    
+    By default the script runs inside this interpreter, which skips a second
+    interpreter start-up. ``isolated`` hands over to a fresh process instead.
+    
+    Args:
+        script: Path of the Python script to run
+        isolated: Run the script in its own interpreter via exec_script
+    """
+    if isolated:
+        exec_script(script)
+        return
+    import runpy
+    sys.argv = [script]
+    runpy.run_path(script, run_name="__main__")
+
+def start_application(isolated=False):
     """Start the main application"""
     print("\nStarting MUSCLE5 Sequence Alignment Tool...")
     
@@ -73,36 +90,44 @@ def start_application():
     os.environ["MUSCLE5_LAUNCHER"] = "1"
     
     # In Codespaces, we need to ensure the app runs with the right server name
-    if is_codespaces():
+    if IS_CODESPACES:
         os.environ["GRADIO_SERVER_NAME"] = "0.0.0.0"
         print("Running in GitHub Codespaces mode")
         
     # Use main app.py if it exists, otherwise fall back to simple_app.py
     if os.path.exists("app.py"):
         print("Launching main application (app.py)...")
-        subprocess.run([sys.executable, "app.py"])
+        run_script("app.py", isolated)
     else:
         print("Main app.py not found, launching simple app...")
-        subprocess.run([sys.executable, "simple_app.py"])
+        run_script("simple_app.py", isolated)
     
     print("\nApplication terminated.")
 
 def main():
     """Main function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Launch the MUSCLE5 Sequence Alignment Tool")
+    parser.add_argument("--isolated", action="store_true",
+                        help="Run the app in a separate Python process instead of this one")
+    args = parser.parse_args()
+    
     print_banner()
     
     # First, ensure MUSCLE5 is set up
     setup_muscle()
     
-    # Start the main application
-    start_application()
-    
-    # Print access instructions for Codespaces
-    if is_codespaces():
+    # Print access instructions for Codespaces up front, since the app
+    # blocks until it exits
+    if IS_CODESPACES:
         print("\nAccessing in GitHub Codespaces:")
         print("1. Look for the 'PORTS' tab at the bottom panel of VS Code")
         print("2. Find port 7860, right-click and select 'Open in Browser'")
         print("3. If you only see a welcome message, try refreshing the browser page")
+    
+    # Start the main application
+    start_application(isolated=args.isolated)
 
 if __name__ == "__main__":
     main()
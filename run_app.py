@@ -1,13 +1,6 @@
 import os
 import sys
-import tempfile
-import subprocess
-import platform
-import webbrowser
 import time
-import threading
-import gradio as gr
-from app import create_ui, check_and_setup_muscle
 
 def is_frozen():
     """Check if the application is running as a PyInstaller frozen executable"""
@@ -19,9 +12,7 @@ def get_base_dir():
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.abspath(__file__))
 
-def create_startup_message():
-    """Create a simple startup message with ASCII art"""
-    ascii_art = """
+BANNER = """
     __  ___                __     ______     _____                                  
    /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
   / /|_/ / / / / ___/ _ \/ / _ \/___ \/ ___/\__ \/ _ \/ __ \/ / / / _ \_  / / / / /
@@ -29,8 +20,10 @@ def create_startup_message():
 /_/  /_/\__,_/____/\___/_/\___/_____/\___//____/\___/_/ /_/\__, /\___/___/\__, /  
                                                           /____/         /____/   
     """
-    
-    message = f"{ascii_art}\n"
+
+def create_startup_message():
+    """Create a simple startup message with ASCII art"""
+    message = f"{BANNER}\n"
     message += "Muscle5 Sequence Alignment Tool is starting...\n"
     message += "A browser window should open automatically.\n\n"
     message += "If it doesn't, please navigate to: http://127.0.0.1:7860\n\n"
@@ -40,6 +33,9 @@ def create_startup_message():
 
 def open_browser():
     """Open browser after a short delay"""
+    import threading
+    import webbrowser
+    
     def _open_browser():
         time.sleep(2)  # Allow Gradio server to start
         webbrowser.open('http://127.0.0.1:7860')
@@ -56,6 +52,9 @@ def main():
     # Create and print startup message
     print(create_startup_message())
     
+    # Import the app (and with it Gradio) only after the banner is on screen
+    from app import create_ui, check_and_setup_muscle
+    
     # Check if MUSCLE5 is available
     muscle_setup_success = check_and_setup_muscle()
     if not muscle_setup_success:
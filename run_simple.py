@@ -8,10 +8,7 @@ import os
 import sys
 from datetime import datetime
 
-# Add helpful banner when starting
-def print_banner():
-    """Print an informative banner when starting the application"""
-    banner = """
+BANNER = """
     __  ___                __     ______     _____                                  
    /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
   / /|_/ / / / / ___/ _ \/ / _ \/___ \/ ___/\__ \/ _ \/ __ \/ / / / _ \_  / / / / /
@@ -19,7 +16,11 @@ def print_banner():
 /_/  /_/\\__,_/____/\\___/_/\\___/_____/\\___//____/\\___/_/ /_/\\__, /\\___/___/\\__, /  
                                                           /____/         /____/   
     """
-    print(banner)
+
+# Add helpful banner when starting
+def print_banner():
+    """Print an informative banner when starting the application"""
+    print(BANNER)
     print("MUSCLE5 Sequence Alignment Tool")
     print(f"Starting application at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("Web interface will be available shortly...")
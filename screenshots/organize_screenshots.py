@@ -11,9 +11,11 @@ This script helps organize screenshots in the repository by:
 
 import os
 import re
+import functools
 from pathlib import Path
 import argparse
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 try:
     from PIL import Image
     PILLOW_AVAILABLE = True
@@ -27,6 +29,20 @@ MAX_IMAGE_WIDTH = 1200  # Maximum width for full-size images
 THUMB_WIDTH = 400       # Width for thumbnails
 SCREENSHOTS_DIR = Path(__file__).parent
 
+# Characters that are not allowed in normalized screenshot names
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif')
+
+# Name fragments used to group screenshots in the README
+UI_KEYWORDS = ('app', 'ui', 'screen', 'interface', 'window')
+ENV_KEYWORDS = ('env', 'setup', 'install', 'config', 'windows', 'mac', 'linux')
+
+def collect_images():
+    """List the image file names in the screenshots directory with a single scan"""
+    with os.scandir(SCREENSHOTS_DIR) as entries:
+        return [entry.name for entry in entries
+                if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()]
+
 def create_thumbnail(image_path, quality=85):
     """Create a thumbnail version of an image"""
     if not PILLOW_AVAILABLE:
@@ -41,6 +57,10 @@ def create_thumbnail(image_path, quality=85):
             aspect = height / width
             new_height = int(THUMB_WIDTH * aspect)
             
+            # Let JPEG decode at a reduced scale (never below the thumbnail
+            # width); this is a no-op for PNG and other formats
+            img.draft(img.mode, (THUMB_WIDTH, 1))
+            
             # Resize image
             resized = img.resize((THUMB_WIDTH, new_height), Image.Resampling.LANCZOS)
             
@@ -60,13 +80,16 @@ def optimize_image(image_path, quality=85):
     
     try:
         with Image.open(image_path) as img:
-            # Check if resizing is needed
+            # Images already within the width limit are left untouched, so
+            # repeated runs don't re-encode them (or churn their git history)
             width, height = img.size
-            if width > MAX_IMAGE_WIDTH:
-                aspect = height / width
-                new_height = int(MAX_IMAGE_WIDTH * aspect)
-                img = img.resize((MAX_IMAGE_WIDTH, new_height), Image.Resampling.LANCZOS)
-                print(f"Resized image from {width}x{height} to {MAX_IMAGE_WIDTH}x{new_height}")
+            if width <= MAX_IMAGE_WIDTH:
+                return
+            
+            aspect = height / width
+            new_height = int(MAX_IMAGE_WIDTH * aspect)
+            img = img.resize((MAX_IMAGE_WIDTH, new_height), Image.Resampling.LANCZOS)
+            print(f"Resized image from {width}x{height} to {MAX_IMAGE_WIDTH}x{new_height}")
             
             # Save with optimized quality
             img.save(image_path, optimize=True, quality=quality)
@@ -74,17 +97,18 @@ def optimize_image(image_path, quality=85):
     except Exception as e:
         print(f"Error optimizing {image_path}: {e}")
 
+@functools.lru_cache(maxsize=None)
 def normalize_filename(filename):
     """Convert filename to lowercase with underscores"""
     # Remove file extension
-    name = os.path.splitext(filename)[0]
-    ext = os.path.splitext(filename)[1].lower()
+    name, ext = os.path.splitext(filename)
+    ext = ext.lower()
     
     # Replace spaces and hyphens with underscores
     name = name.replace(' ', '_').replace('-', '_')
     
     # Remove any special characters
-    name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+    name = _SANITIZE_RE.sub('', name)
     
     # Convert to lowercase
     name = name.lower()
@@ -92,54 +116,71 @@ def normalize_filename(filename):
     # Add extension back
     return f"{name}{ext}"
 
-def rename_screenshots():
+def process_images(func, paths):
+    """Run an image operation over several files, one worker process per core
+    
+    Pillow's decode/resize/encode is CPU-bound and independent per file, so
+    the files are processed in parallel. A single file skips the pool.
+    """
+    if len(paths) < 2:
+        for path in paths:
+            func(path)
+        return
+    with ProcessPoolExecutor() as pool:
+        list(pool.map(func, paths))
+
+def rename_screenshots(images=None):
     """Rename all screenshots according to naming convention"""
     renamed_files = []
+    if images is None:
+        images = collect_images()
     
-    for file in os.listdir(SCREENSHOTS_DIR):
-        # Skip Python files and directories
-        if file.endswith('.py') or file == 'README.md' or os.path.isdir(os.path.join(SCREENSHOTS_DIR, file)):
+    # Check destinations against the listing instead of stat-ing each one
+    existing = set(images)
+    
+    for file in images:
+        old_path = os.path.join(SCREENSHOTS_DIR, file)
+        new_filename = normalize_filename(file)
+        new_path = os.path.join(SCREENSHOTS_DIR, new_filename)
+        
+        # Skip if already normalized
+        if old_path == new_path:
             continue
             
-        # Check if file is an image
-        if file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-            old_path = os.path.join(SCREENSHOTS_DIR, file)
-            new_filename = normalize_filename(file)
-            new_path = os.path.join(SCREENSHOTS_DIR, new_filename)
+        # Check if destination exists
+        if new_filename in existing:
+            print(f"Skipping {file}: Destination {new_filename} already exists")
+            continue
             
-            # Skip if already normalized
-            if old_path == new_path:
-                continue
-                
-            # Check if destination exists
-            if os.path.exists(new_path):
-                print(f"Skipping {file}: Destination {new_filename} already exists")
-                continue
-                
-            # Rename the file
-            os.rename(old_path, new_path)
-            print(f"Renamed: {file} -> {new_filename}")
-            renamed_files.append((file, new_filename))
+        # Rename the file
+        os.rename(old_path, new_path)
+        existing.discard(file)
+        existing.add(new_filename)
+        print(f"Renamed: {file} -> {new_filename}")
+        renamed_files.append((file, new_filename))
     
     return renamed_files
 
-def update_screenshots_readme():
+def update_screenshots_readme(images=None):
     """Update the screenshots README.md with current screenshots"""
     readme_path = os.path.join(SCREENSHOTS_DIR, "README.md")
+    if images is None:
+        images = collect_images()
     
-    # Get list of screenshots
-    screenshots = []
-    for file in os.listdir(SCREENSHOTS_DIR):
-        if file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-            # Skip thumbnail files
-            if "_thumb" in file:
-                continue
-            screenshots.append(file)
+    # Get list of screenshots, skipping thumbnail files
+    screenshots = [file for file in images if "_thumb" not in file]
     
-    # Group screenshots by type
-    ui_screenshots = [s for s in screenshots if any(kw in s for kw in ['app', 'ui', 'screen', 'interface', 'window'])]
-    env_screenshots = [s for s in screenshots if any(kw in s for kw in ['env', 'setup', 'install', 'config', 'windows', 'mac', 'linux'])]
-    other_screenshots = [s for s in screenshots if s not in ui_screenshots and s not in env_screenshots]
+    # Group screenshots by type in one pass; a name may match both groups
+    ui_screenshots, env_screenshots, other_screenshots = [], [], []
+    for s in screenshots:
+        is_ui = any(kw in s for kw in UI_KEYWORDS)
+        is_env = any(kw in s for kw in ENV_KEYWORDS)
+        if is_ui:
+            ui_screenshots.append(s)
+        if is_env:
+            env_screenshots.append(s)
+        if not (is_ui or is_env):
+            other_screenshots.append(s)
     
     # Backup existing README if it exists
     if os.path.exists(readme_path):
@@ -218,28 +259,30 @@ def main():
         parser.print_help()
         return
     
+    # Scan the directory once and reuse the listing for every step
+    images = collect_images()
+    
     # Process based on arguments
     if args.rename or args.all:
-        rename_screenshots()
+        renamed = dict(rename_screenshots(images))
+        images = [renamed.get(file, file) for file in images]
     
     if args.optimize or args.all:
         if PILLOW_AVAILABLE:
-            for file in os.listdir(SCREENSHOTS_DIR):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    optimize_image(os.path.join(SCREENSHOTS_DIR, file))
+            process_images(optimize_image, [os.path.join(SCREENSHOTS_DIR, file) for file in images
+                                            if file.lower().endswith(('.png', '.jpg', '.jpeg'))])
         else:
             print("Image optimization skipped: Pillow library not available")
     
     if args.thumbnails or args.all:
         if PILLOW_AVAILABLE:
-            for file in os.listdir(SCREENSHOTS_DIR):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')) and not "_thumb" in file:
-                    create_thumbnail(Path(SCREENSHOTS_DIR) / file)
+            process_images(create_thumbnail, [Path(SCREENSHOTS_DIR) / file for file in images
+                                              if file.lower().endswith(('.png', '.jpg', '.jpeg')) and not "_thumb" in file])
         else:
             print("Thumbnail generation skipped: Pillow library not available")
     
     if args.update_readme or args.all:
-        update_screenshots_readme()
+        update_screenshots_readme(images)
     
     print("Screenshot organization completed!")
 
@@ -9,15 +9,18 @@ def get_version():
             return f.read().strip()
     return "1.0.0"  # Default version if file doesn't exist
 
-# Read requirements
+# Read requirements and dev requirements in a single pass over the file
 def get_requirements():
+    install, dev = [], []
     with open("requirements.txt") as f:
-        return [line.split('#')[0].strip() for line in f if line.strip() and not line.startswith('#')]
+        for line in f:
+            if 'extra == \'dev\'' in line:
+                dev.append(line.split('#')[0].strip())
+            if line.strip() and not line.startswith('#'):
+                install.append(line.split('#')[0].strip())
+    return install, dev
 
-# Extract dev requirements
-def get_dev_requirements():
-    with open("requirements.txt") as f:
-        return [line.split('#')[0].strip() for line in f if 'extra == \'dev\'' in line]
+install_requires, dev_requires = get_requirements()
 
 setup(
     name="muscle5-sequence-alignment-tool",
@@ -28,9 +31,9 @@ setup(
     url="https://github.com/tayden1990/bioinformatic-python-alignment-muscle5",
     packages=find_packages(),
     include_package_data=True,
-    install_requires=get_requirements(),
+    install_requires=install_requires,
     extras_require={
-        'dev': get_dev_requirements(),
+        'dev': dev_requires,
     },
     entry_points={
         'console_scripts': [
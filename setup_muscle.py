@@ -7,55 +7,154 @@ Works in both local and Codespaces environments
 
 import os
 import sys
-import platform
 import subprocess
 import tempfile
+import time
 import urllib.request
 import shutil
 import zipfile
 import stat
 from pathlib import Path
 
+from utils.platform_info import OS_NAME, MACHINE
+from utils.compatibility import IS_CODESPACES
+
 def print_step(message):
     """Print a step in the setup process"""
     print(f"\n[SETUP] {message}")
 
-def is_codespaces():
-    """Check if running in GitHub Codespaces environment"""
-    return "CODESPACES" in os.environ or "CODESPACE_NAME" in os.environ
+# Send a browser user agent to avoid 403 errors
+DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+DOWNLOAD_PARTS = 4  # Parallel range requests used when the server supports them
+
+_last_progress = 0.0
+
+def print_progress(downloaded, total_size):
+    """Overwrite the current console line with the download progress
+    
+    Updates are limited to ten per second, and logs that are not a terminal
+    (which don't render the carriage return) only get the final line.
+    """
+    global _last_progress
+    finished = downloaded == total_size
+    if not finished:
+        now = time.monotonic()
+        if now - _last_progress < 0.1 or not sys.stdout.isatty():
+            return
+        _last_progress = now
+    
+    if total_size > 0:
+        percent = int(downloaded * 100 / total_size)
+        sys.stdout.write(f"\rDownloading... {percent}% ({downloaded} / {total_size} bytes)")
+    else:
+        sys.stdout.write(f"\rDownloading... {downloaded} bytes")
+    sys.stdout.flush()
+
+class ProgressWriter:
+    """File wrapper that reports progress for every chunk written through it"""
+    
+    def __init__(self, out_file, total_size):
+        self.out_file = out_file
+        self.total_size = total_size
+        self.downloaded = 0
+    
+    def write(self, chunk):
+        written = self.out_file.write(chunk)
+        self.downloaded += len(chunk)
+        print_progress(self.downloaded, self.total_size)
+        return written
+
+def probe_download(url):
+    """Ask the server about a download without fetching it
+    
+    Args:
+        url: URL to query with a HEAD request
+        
+    Returns:
+        Tuple of (size in bytes, or 0 if unknown; whether byte ranges are accepted)
+    """
+    head = urllib.request.Request(url, headers=DOWNLOAD_HEADERS, method="HEAD")
+    with urllib.request.urlopen(head) as response:
+        total_size = int(response.headers.get('Content-Length', 0))
+        accepts_ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+    return total_size, accepts_ranges
+
+def download_ranges(url, output_path, parts=DOWNLOAD_PARTS):
+    """Download a file as several parallel HTTP range requests
+    
+    Args:
+        url: URL to download
+        output_path: Where to write the file
+        parts: Number of ranges fetched concurrently
+        
+    Returns:
+        True if the file was written, False if the server does not support
+        range requests (the caller should then fall back to a single stream)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    total_size, accepts_ranges = probe_download(url)
+    if not accepts_ranges or total_size < parts:
+        return False
+    
+    import threading
+    
+    data = bytearray(total_size)
+    view = memoryview(data)
+    step = -(-total_size // parts)  # Ceiling division
+    progress = {"done": 0}
+    lock = threading.Lock()
+    
+    def fetch(start):
+        end = min(start + step, total_size)
+        req = urllib.request.Request(url, headers={**DOWNLOAD_HEADERS, 'Range': f"bytes={start}-{end - 1}"})
+        with urllib.request.urlopen(req) as response:
+            if response.status != 206:
+                return False
+            # Read straight into this range's slice of the shared buffer
+            pos = start
+            while pos < end:
+                count = response.readinto(view[pos:min(pos + 1024 * 1024, end)])
+                if not count:
+                    return False
+                pos += count
+                with lock:
+                    progress["done"] += count
+                    print_progress(progress["done"], total_size)
+        return True
+    
+    with ThreadPoolExecutor(max_workers=parts) as pool:
+        ok = all(pool.map(fetch, range(0, total_size, step)))
+    print()  # New line after progress
+    if not ok:
+        return False
+    
+    with open(output_path, 'wb') as out_file:
+        out_file.write(data)
+    print(f"Downloaded {total_size} bytes in {parts} parts")
+    return True
 
 def download_file(url, output_path):
     """Download a file from URL to output path with progress"""
     try:
         print(f"Downloading from {url} to {output_path}")
         
-        # Create a request with a user agent to avoid 403 errors
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        req = urllib.request.Request(url, headers=headers)
+        # Fetch in parallel ranges when possible; any failure falls back to
+        # the single-stream download below
+        try:
+            if download_ranges(url, output_path):
+                return True
+        except Exception:
+            pass
+        
+        req = urllib.request.Request(url, headers=DOWNLOAD_HEADERS)
         
         with urllib.request.urlopen(req) as response, open(output_path, 'wb') as out_file:
             total_size = int(response.info().get('Content-Length', 0))
-            downloaded = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-            
-            while True:
-                chunk = response.read(chunk_size)
-                if not chunk:
-                    break
-                downloaded += len(chunk)
-                out_file.write(chunk)
-                
-                # Print progress
-                if total_size > 0:
-                    percent = int(downloaded * 100 / total_size)
-                    sys.stdout.write(f"\rDownloading... {percent}% ({downloaded} / {total_size} bytes)")
-                    sys.stdout.flush()
-                else:
-                    sys.stdout.write(f"\rDownloading... {downloaded} bytes")
-                    sys.stdout.flush()
-            
+            # copyfileobj drives the copy in 1MB chunks; the wrapper reports progress
+            shutil.copyfileobj(response, ProgressWriter(out_file, total_size), 1024 * 1024)
             print()  # New line after progress
             return True
     except urllib.error.HTTPError as e:
@@ -74,28 +173,29 @@ def make_executable(path):
     current_mode = os.stat(path).st_mode
     os.chmod(path, current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
+# Updated URLs for MUSCLE5 - now using the updated muscle website URLs
+MUSCLE5_BASE_URL = "https://drive5.com/muscle5/"
+
+# (system, is_arm) -> (download URL, local executable name)
+MUSCLE5_DOWNLOADS = {
+    ("windows", False): (f"{MUSCLE5_BASE_URL}muscle5.1.win64.exe", "muscle5.exe"),
+    ("darwin", True): (f"{MUSCLE5_BASE_URL}muscle5.1.macos_arm64", "muscle5"),
+    ("darwin", False): (f"{MUSCLE5_BASE_URL}muscle5.1.macos_intel64", "muscle5"),
+    ("linux", True): (f"{MUSCLE5_BASE_URL}muscle5.1.linux_arm64", "muscle5"),
+    ("linux", False): (f"{MUSCLE5_BASE_URL}muscle5.1.linux_intel64", "muscle5"),
+}
+
 def get_muscle5_download_url():
     """Get the appropriate MUSCLE5 download URL for the current platform"""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
-    
-    # Updated URLs for MUSCLE5 - now using the updated muscle website URLs
-    base_url = "https://drive5.com/muscle5/"
+    system = OS_NAME.lower()
+    machine = MACHINE.lower()
+    # Windows only has an x64 build, which also runs on ARM through emulation
+    is_arm = system != "windows" and ("arm" in machine or "aarch64" in machine)
     
-    if system == "windows":
-        return f"{base_url}muscle5.1.win64.exe", "muscle5.exe"
-    elif system == "darwin":  # macOS
-        if "arm" in machine or "aarch64" in machine:
-            return f"{base_url}muscle5.1.macos_arm64", "muscle5"
-        else:
-            return f"{base_url}muscle5.1.macos_intel64", "muscle5"
-    elif system == "linux":
-        if "aarch64" in machine or "arm" in machine:
-            return f"{base_url}muscle5.1.linux_arm64", "muscle5"
-        else:
-            return f"{base_url}muscle5.1.linux_intel64", "muscle5"
-    else:
-        raise RuntimeError(f"Unsupported platform: {system} {machine}")
+    try:
+        return MUSCLE5_DOWNLOADS[(system, is_arm)]
+    except KeyError:
+        raise RuntimeError(f"Unsupported platform: {system} {machine}") from None
 
 def extract_tar_gz(tar_path, target_dir):
     """Extract a tar.gz file to the target directory"""
@@ -110,18 +210,64 @@ def extract_tar_gz(tar_path, target_dir):
 
 def find_muscle_executable(dir_path):
     """Find the MUSCLE executable in the extracted directory"""
-    for root, _, files in os.walk(dir_path):
-        for file in files:
-            if file.lower().startswith("muscle") and (file.lower().endswith(".exe") or "." not in file):
-                return os.path.join(root, file)
+    # Depth-first scandir walk that stops at the first match; DirEntry
+    # answers is_dir() from the directory listing without an extra stat
+    pending = [dir_path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                    continue
+                name = entry.name.lower()
+                if name.startswith("muscle") and (name.endswith(".exe") or "." not in name):
+                    return entry.path
     return None
 
+# Downloads are kept here so fresh environments (and restored CI caches) can skip the network
+DOWNLOAD_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "muscle5")
+
+def read_configured_path(config_path):
+    """Return the executable path stored in the config file if it still exists
+    
+    Args:
+        config_path: Path to muscle_config.txt
+        
+    Returns:
+        The configured path, or None if the config or the executable is missing
+    """
+    try:
+        with open(config_path, "r") as f:
+            muscle_path = f.read().strip()
+        if muscle_path:
+            os.stat(muscle_path)
+            return muscle_path
+    except OSError:
+        pass
+    return None
+
+def write_config(config_path, muscle_path):
+    """Atomically store the executable path in the config file
+    
+    The path is written to a temporary file that then replaces the config, so
+    an interrupted write can never leave a truncated path behind.
+    
+    Args:
+        config_path: Path to muscle_config.txt
+        muscle_path: Executable path to record
+    """
+    tmp_path = config_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(muscle_path)
+    os.replace(tmp_path, config_path)
+
 def setup_muscle5(force=False):
     """Set up MUSCLE5 executable"""
     print_step("Setting up MUSCLE5 executable")
     
     # Define the target directory
-    if is_codespaces():
+    if IS_CODESPACES:
         # In Codespaces, store in workspace
         target_dir = os.path.abspath("bin")
     else:
@@ -133,12 +279,11 @@ def setup_muscle5(force=False):
     
     # Check if already configured
     config_path = os.path.abspath("muscle_config.txt")
-    if os.path.exists(config_path) and not force:
-        with open(config_path, "r") as f:
-            muscle_path = f.read().strip()
-            if os.path.exists(muscle_path):
-                print(f"MUSCLE5 already configured at: {muscle_path}")
-                return muscle_path
+    if not force:
+        muscle_path = read_configured_path(config_path)
+        if muscle_path:
+            print(f"MUSCLE5 already configured at: {muscle_path}")
+            return muscle_path
     
     # Get platform-specific download URL and executable name
     try:
@@ -149,13 +294,43 @@ def setup_muscle5(force=False):
         print_manual_instructions()
         return None
     
-    # Download MUSCLE5
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    # A binary already installed with the same size as the remote file only
+    # needs its config entry restored, not another download
+    target_path = os.path.join(target_dir, exe_name)
+    if os.path.isfile(target_path):
+        try:
+            remote_size, _ = probe_download(url)
+        except Exception:
+            remote_size = 0
+        if remote_size and remote_size == os.path.getsize(target_path):
+            if OS_NAME != "Windows":
+                make_executable(target_path)
+            write_config(config_path, target_path)
+            print(f"MUSCLE5 already installed at: {target_path}")
+            return target_path
+    
+    # Download MUSCLE5 into a scratch directory next to the target, so the
+    # final move is a rename rather than another copy of the binary
+    with tempfile.TemporaryDirectory(dir=target_dir) as tmp_dir:
         download_path = os.path.join(tmp_dir, exe_name)
         extract_dir = os.path.join(tmp_dir, "extracted")
         os.makedirs(extract_dir, exist_ok=True)
         
-        if download_file(url, download_path):
+        cached_path = os.path.join(DOWNLOAD_CACHE_DIR, os.path.basename(url))
+        if not force and os.path.isfile(cached_path):
+            print(f"Using cached download: {cached_path}")
+            shutil.copyfile(cached_path, download_path)
+            downloaded = True
+        else:
+            downloaded = download_file(url, download_path)
+            if downloaded:
+                try:
+                    os.makedirs(DOWNLOAD_CACHE_DIR, exist_ok=True)
+                    shutil.copyfile(download_path, cached_path)
+                except OSError:
+                    pass  # Caching the download is optional
+        
+        if downloaded:
             # Check if the downloaded file is already an executable (not an archive)
             if not url.endswith('.tar.gz'):
                 # It's a direct executable, no need to extract
@@ -173,21 +348,13 @@ def setup_muscle5(force=False):
                     print_manual_instructions()
                     return None
             
-            # Make executable if needed (for Unix)
-            if platform.system() != "Windows":
-                make_executable(muscle_path)
-            
-            # Move to target directory
-            target_path = os.path.join(target_dir, exe_name)
+            # Move to target directory, then make executable if needed (for Unix)
             shutil.move(muscle_path, target_path)
-            
-            # Make executable again after moving (just to be sure)
-            if platform.system() != "Windows":
+            if OS_NAME != "Windows":
                 make_executable(target_path)
             
             # Save the path to config file
-            with open(config_path, "w") as f:
-                f.write(target_path)
+            write_config(config_path, target_path)
             
             print(f"MUSCLE5 installed at: {target_path}")
             return target_path
@@ -225,11 +392,7 @@ def main():
         
         # Test MUSCLE5
         try:
-            if platform.system() == "Windows":
-                result = subprocess.run([muscle_path, "-version"], capture_output=True, text=True)
-            else:
-                result = subprocess.run([muscle_path, "-version"], capture_output=True, text=True)
-                
+            result = subprocess.run([muscle_path, "-version"], capture_output=True, text=True, timeout=5)
             print(f"\nMUSCLE5 version information:")
             print(result.stdout.strip())
         except Exception as e:
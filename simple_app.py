@@ -4,13 +4,14 @@ Simple Launcher for MUSCLE5 Sequence Alignment Tool
 Compatible with newer versions of Gradio (4.x+)
 """
 
-import os
 import sys
-import platform
-from datetime import datetime
+
+from utils.compatibility import IS_CODESPACES
 
 def print_banner():
     """Print a welcome banner"""
+    from datetime import datetime
+    
     banner = """
     __  ___                __     ______     _____                                  
    /  |/  /_  _________  / /__  / ____/____/ ___/___  _____  __  _____ ____  ______
@@ -24,15 +25,24 @@ def print_banner():
     print(f"Starting application at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("Web interface will be available shortly...\n")
 
-def is_codespaces():
-    """Check if running in GitHub Codespaces environment"""
-    return "CODESPACES" in os.environ or "CODESPACE_NAME" in os.environ
-
 def main():
     print_banner()
     
     print("Loading application modules...")
     
+    # Importing app pulls in Gradio and the plotting stack, which takes a few
+    # seconds; do it in the background while MUSCLE5 is checked (and set up
+    # if needed) through the lightweight utils.muscle_path module
+    import threading
+    loader = threading.Thread(target=__import__, args=("app",), daemon=True)
+    loader.start()
+    
+    # Check and setup MUSCLE5
+    print("Checking MUSCLE5 installation...")
+    from utils.muscle_path import check_and_setup_muscle as setup_muscle_early
+    muscle_ready = setup_muscle_early()
+    
+    loader.join()
     # Import app creation and check functions
     from app import create_ui, check_and_setup_muscle
     import gradio as gr
@@ -41,9 +51,9 @@ def main():
     gradio_version = getattr(gr, "__version__", "unknown")
     print(f"Detected Gradio version: {gradio_version}")
     
-    # Check and setup MUSCLE5
-    print("Checking MUSCLE5 installation...")
-    check_and_setup_muscle()
+    # Let the app pick up a path the setup above may have just written
+    if muscle_ready:
+        check_and_setup_muscle()
     
     # Create the app interface
     print("Creating user interface...")
@@ -59,7 +69,7 @@ def main():
     }
     
     # For Codespaces, we need specific settings
-    if is_codespaces():
+    if IS_CODESPACES:
         print("Running in GitHub Codespaces environment")
     else:
         print("Running in local environment")
@@ -1,27 +1,30 @@
 import unittest
 import os
 import sys
-import importlib.util
+import functools
+import importlib
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Try to find the main application file
-potential_app_files = ["app.py", "main.py", "muscle_aligner.py", "aligner.py"]
-app_module = None
+# Candidate names of the main application module
+APP_MODULE_NAMES = ("app", "main", "muscle_aligner", "aligner")
+potential_app_files = [f"{name}.py" for name in APP_MODULE_NAMES]
 
-for filename in potential_app_files:
-    if os.path.exists(filename):
-        print(f"Found potential application file: {filename}")
+@functools.lru_cache(maxsize=1)
+def load_app_module():
+    """Import the first application module that exists, only when a test needs it"""
+    for name in APP_MODULE_NAMES:
+        if not os.path.exists(f"{name}.py"):
+            continue
+        print(f"Found potential application file: {name}.py")
         try:
-            # Try to import the module
-            spec = importlib.util.spec_from_file_location("app_module", filename)
-            app_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(app_module)
-            print(f"Successfully imported {filename}")
-            break
+            module = importlib.import_module(name)
+            print(f"Successfully imported {name}.py")
+            return module
         except Exception as e:
-            print(f"Error importing {filename}: {e}")
+            print(f"Error importing {name}.py: {e}")
+    return None
 
 class TestApplicationExists(unittest.TestCase):
     
@@ -32,13 +35,74 @@ class TestApplicationExists(unittest.TestCase):
             print("WARNING: No application files found.")
         self.assertTrue(app_files_exist, "At least one application file should exist")
     
-    @unittest.skipIf(app_module is None, "No application module could be imported")
     def test_module_attributes(self):
         """Test if the application module has expected attributes"""
+        app_module = load_app_module()
+        if app_module is None:
+            self.skipTest("No application module could be imported")
         # This is a basic check - adjust based on your actual application
         dir_contents = dir(app_module)
         print(f"Module contains these attributes: {dir_contents}")
         self.assertTrue(len(dir_contents) > 0, "Module should have attributes")
 
+class TestConservationAnalysis(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        if not hasattr(cls.app, "identify_variations"):
+            raise unittest.SkipTest("Application module did not fully import")
+    
+    @staticmethod
+    def make_alignment(*seqs):
+        from Bio.Seq import Seq
+        from Bio.SeqRecord import SeqRecord
+        from Bio.Align import MultipleSeqAlignment
+        return MultipleSeqAlignment(
+            [SeqRecord(Seq(seq), id=f"seq{i}") for i, seq in enumerate(seqs)]
+        )
+    
+    def test_identify_variations(self):
+        """Gaps, N and lowercase columns are neither SNPs nor conserved"""
+        alignment = self.make_alignment(
+            "ACGTAC-TNaGG",
+            "ACGAACGTAaGT",
+            "ACGTACGTAaGG",
+        )
+        snps, conserved = self.app.identify_variations(alignment)
+        self.assertEqual(snps, [3, 11])
+        self.assertEqual(conserved, [0, 1, 2, 4, 5, 7, 10])
+    
+    def test_identify_variations_single_sequence(self):
+        """A single sequence has nothing to compare against"""
+        alignment = self.make_alignment("ACGT")
+        self.assertEqual(self.app.identify_variations(alignment), ([], []))
+    
+    def test_find_conserved_regions(self):
+        """Adjacent conserved positions are merged into regions"""
+        alignment = self.make_alignment(
+            "ACGTAC-TNaGG",
+            "ACGAACGTAaGT",
+            "ACGTACGTAaGG",
+        )
+        _, conserved = self.app.identify_variations(alignment)
+        regions = self.app.find_conserved_regions(alignment, conserved)
+        self.assertEqual(regions, [
+            (0, 2, 3, "ACG"),
+            (4, 5, 2, "AC"),
+            (7, 7, 1, "T"),
+            (10, 10, 1, "G"),
+        ])
+        self.assertEqual(self.app.find_conserved_regions(alignment, []), [])
+    
+    def test_encoding_follows_alignment_changes(self):
+        """Appending a record invalidates the cached encoding"""
+        from Bio.SeqRecord import SeqRecord
+        from Bio.Seq import Seq
+        alignment = self.make_alignment("ACGT", "ACGT")
+        self.assertEqual(self.app.identify_variations(alignment), ([], [0, 1, 2, 3]))
+        alignment.append(SeqRecord(Seq("ACGA"), id="seq2"))
+        self.assertEqual(self.app.identify_variations(alignment), ([3], [0, 1, 2]))
+
 if __name__ == "__main__":
     unittest.main()
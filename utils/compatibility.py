@@ -5,28 +5,48 @@ This helps the application run across different environments including GitHub Co
 
 import os
 import sys
-import pkg_resources
-import importlib
+import functools
 import logging
+from importlib.metadata import version, PackageNotFoundError
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("compatibility")
 
+@functools.lru_cache(maxsize=None)
 def get_package_version(package_name):
     """Get the version of an installed package"""
     try:
-        return pkg_resources.get_distribution(package_name).version
-    except pkg_resources.DistributionNotFound:
+        return version(package_name)
+    except PackageNotFoundError:
         return None
 
-# Get installed Gradio version
-GRADIO_VERSION = get_package_version("gradio")
-logger.info(f"Detected Gradio version: {GRADIO_VERSION}")
+@functools.lru_cache(maxsize=1)
+def gradio_version():
+    """Get the installed Gradio version, looked up the first time it is needed"""
+    detected = get_package_version("gradio")
+    logger.info("Detected Gradio version: %s", detected)
+    return detected
+
+@functools.lru_cache(maxsize=1)
+def gradio_major_version():
+    """Get the major version of the installed Gradio, or None if not installed"""
+    detected = gradio_version()
+    if not detected:
+        return None
+    # Version handles pre-release suffixes such as 4.0.0a1
+    from packaging.version import Version
+    return Version(detected).major
+
+# Any of these marks a Codespaces (or Codespaces-like) environment
+CODESPACES_ENV_VARS = ("CODESPACES", "CODESPACE_NAME", "MUSCLE5_CODESPACES_MODE")
+
+# The environment does not change while we run, so check it once
+IS_CODESPACES = any(var in os.environ for var in CODESPACES_ENV_VARS)
 
 def is_codespaces():
     """Check if running in GitHub Codespaces environment"""
-    return "CODESPACES" in os.environ or "CODESPACE_NAME" in os.environ or "MUSCLE5_CODESPACES_MODE" in os.environ
+    return IS_CODESPACES
 
 def is_key_in_dict(d, key):
     """Safely check if a key is in a dictionary, handling non-dict types"""
@@ -55,6 +75,26 @@ def is_compatible_python_version():
     
     return True
 
+# launch() arguments that break or are ignored under Codespaces port forwarding
+CODESPACES_UNSUPPORTED_PARAMS = frozenset({'host', 'height', 'prevent_thread_lock', 'show_error'})
+
+def log_launch_url(result, attr, message, rule="-" * 40, *notes):
+    """
+    Log a URL from the launch result between two rules, if it is set
+    
+    Args:
+        result: Value returned by app.launch()
+        attr: Name of the URL attribute, e.g. 'share_url'
+        message: Log format string with one %s for the URL
+        rule: Line logged before and after the URL
+        *notes: Extra lines logged after the URL
+    """
+    url = getattr(result, attr, None)
+    if not url:
+        return
+    # One record for the whole block; the text is only built if INFO is enabled
+    logger.info("\n".join((rule, message, *notes, rule)), url)
+
 def launch_app(app, **kwargs):
     """
     Launch a Gradio app with appropriate settings for the environment.
@@ -67,23 +107,22 @@ def launch_app(app, **kwargs):
     Returns:
         The result of app.launch()
     """
-    # Default to share=True if not specified
+    # Default to a public share link, except in Codespaces where the port is
+    # already forwarded and the gradio.live tunnel would only slow startup
     if 'share' not in kwargs:
-        kwargs['share'] = True
+        kwargs['share'] = not IS_CODESPACES
         
     # For GitHub Codespaces, we need specific settings
-    if is_codespaces():
+    if IS_CODESPACES:
         logger.info("Running in GitHub Codespaces environment")
         # Set server_name to 0.0.0.0 for Codespaces
         kwargs['server_name'] = '0.0.0.0'
         
         # Remove any problematic parameters
-        for param in ['host', 'height', 'prevent_thread_lock', 'show_error']:
-            if param in kwargs:
-                del kwargs[param]
+        kwargs = {k: v for k, v in kwargs.items() if k not in CODESPACES_UNSUPPORTED_PARAMS}
                 
         # Check which version of Gradio we're using
-        if GRADIO_VERSION and GRADIO_VERSION.startswith('4.'):
+        if (gradio_major_version() or 0) >= 4:
             logger.info("Using Gradio 4.x in Codespaces")
             
             try:
@@ -101,24 +140,16 @@ def launch_app(app, **kwargs):
                 # Basic launch for Gradio 4.x
                 result = app.launch(**kwargs)
                 
-                # Show the URL prominently
-                if hasattr(result, 'local_url') and result.local_url:
-                    logger.info("\n" + "=" * 70)
-                    logger.info("🚀 LOCAL URL (within Codespaces): %s", result.local_url)
-                    logger.info("Open this URL in browser or click 'Open in Browser' in the PORTS tab")
-                    logger.info("=" * 70)
-                    
-                # Show the sharing URL if available
-                if hasattr(result, 'share_url') and result.share_url:
-                    logger.info("\n" + "=" * 70)
-                    logger.info("🌎 PUBLIC SHARING URL: %s", result.share_url)
-                    logger.info("=" * 70 + "\n")
+                # Show the URL prominently, and the sharing URL if available
+                log_launch_url(result, "local_url", "🚀 LOCAL URL (within Codespaces): %s", "=" * 70,
+                               "Open this URL in browser or click 'Open in Browser' in the PORTS tab")
+                log_launch_url(result, "share_url", "🌎 PUBLIC SHARING URL: %s", "=" * 70)
                 
                 return result
             except Exception as e:
-                logger.warning(f"Standard launch failed with error: {str(e)}")
+                logger.warning("Standard launch failed with error: %s", e)
                 # Simplest possible fallback
-                return app.launch(server_name='0.0.0.0', share=True)
+                return app.launch(server_name='0.0.0.0', share=kwargs['share'])
         else:
             # For Gradio 3.x
             logger.info("Using Codespaces-compatible launch settings for Gradio 3.x")
@@ -130,13 +161,7 @@ def launch_app(app, **kwargs):
                     **kwargs
                 )
                 if kwargs['share']:
-                    try:
-                        if hasattr(result, 'share_url') and result.share_url:
-                            logger.info("----------------------------------------")
-                            logger.info("🌎 Public URL: %s", result.share_url)
-                            logger.info("----------------------------------------")
-                    except AttributeError:
-                        pass
+                    log_launch_url(result, "share_url", "🌎 Public URL: %s")
                 return result
             except TypeError as e:
                 if "not iterable" in str(e):
@@ -150,15 +175,9 @@ def launch_app(app, **kwargs):
         try:
             result = app.launch(**kwargs)
             if kwargs['share']:
-                try:
-                    if hasattr(result, 'share_url') and result.share_url:
-                        logger.info("----------------------------------------")
-                        logger.info("🌎 Public URL: %s", result.share_url)
-                        logger.info("----------------------------------------")
-                except AttributeError:
-                    pass
+                log_launch_url(result, "share_url", "🌎 Public URL: %s")
             return result
         except Exception as e:
-            logger.warning(f"Standard launch failed with error: {str(e)}")
+            logger.warning("Standard launch failed with error: %s", e)
             logger.info("Trying simplified launch approach...")
             return app.launch(share=True, server_name='0.0.0.0')
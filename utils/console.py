@@ -0,0 +1,54 @@
+"""Colored terminal output, buffered so each script writes it in one go."""
+
+import os
+import sys
+
+# ANSI color codes used by print_colored
+_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+    "reset": "\033[0m",
+    "bold": "\033[1m"
+}
+
+# Output is collected here and written to the terminal in one go by flush_output
+_BUF = []
+
+def colored(text, color):
+    """Return text wrapped in the color's ANSI codes, as one output line"""
+    return f"{_COLORS.get(color, '')}{text}{_COLORS['reset']}\n"
+
+def queue_output(text):
+    """Queue already formatted text for the terminal"""
+    _BUF.append(text)
+
+def print_colored(text, color):
+    """Queue colored text for the terminal"""
+    _BUF.append(colored(text, color))
+
+def flush_output():
+    """Write all queued output with a single call"""
+    sys.stdout.write("".join(_BUF))
+    _BUF.clear()
+    sys.stdout.flush()
+
+def clear_screen():
+    """Queue ANSI escape codes that clear the terminal, instead of spawning a shell"""
+    if not sys.stdout.isatty():
+        return
+    
+    if os.name == 'nt':
+        # Make sure the Windows console interprets VT sequences
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    
+    _BUF.append("\x1b[2J\x1b[H")
@@ -1,13 +1,18 @@
 """Utility module for handling MUSCLE5 executable path detection and validation."""
 
 import os
-import platform
+import sys
+import functools
+import json
+import shutil
 import subprocess
-from pathlib import Path
 
+from utils.platform_info import OS_NAME
+
+@functools.lru_cache(maxsize=1)
 def get_default_muscle_path():
     """Returns the default muscle path based on operating system"""
-    if platform.system() == "Windows":
+    if OS_NAME == "Windows":
         # Check common Windows locations
         paths = [
             os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "muscle", "muscle.exe"),
@@ -15,7 +20,7 @@ def get_default_muscle_path():
             "muscle.exe",  # If in PATH or current directory
             "muscle-win64.v5.3.exe"  # Common downloaded name
         ]
-    elif platform.system() == "Darwin":  # macOS
+    elif OS_NAME == "Darwin":  # macOS
         paths = [
             "/usr/local/bin/muscle",
             "/opt/homebrew/bin/muscle",
@@ -28,32 +33,39 @@ def get_default_muscle_path():
             "muscle"  # If in PATH or current directory
         ]
     
-    # Check if any path exists
+    # Check if any path exists; bare names are also looked up on PATH
     for path in paths:
         if os.path.exists(path):
             return path
+        if not os.path.dirname(path):
+            found = shutil.which(path)
+            if found:
+                return found
     
     # Return a default that will be checked later
     return "muscle"
 
+@functools.lru_cache(maxsize=1)
 def get_configured_muscle_path():
     """
     Get the MUSCLE5 path from configuration file or environment
     
+    The result is cached; save_muscle_path and run_muscle_setup clear it
+    when they change the configuration.
+    
     Returns:
         Path to MUSCLE5 executable
     """
     # First check configuration file
     config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "muscle_config.txt")
     
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r") as f:
-                muscle_path = f.read().strip()
-                if os.path.exists(muscle_path):
-                    return muscle_path
-        except:
-            pass
+    try:
+        with open(config_path, "r") as f:
+            muscle_path = f.read().strip()
+            if os.path.exists(muscle_path):
+                return muscle_path
+    except (OSError, ValueError):
+        pass
     
     # Then check environment variable
     muscle_path = os.environ.get("MUSCLE5_PATH")
@@ -63,6 +75,52 @@ def get_configured_muscle_path():
     # Finally use default path
     return get_default_muscle_path()
 
+# Successful validations keyed by (path, mtime, size) so a known-good binary is only probed once
+_VALIDATE_CACHE = {}
+
+# The same keys, kept across runs so a known-good binary isn't probed on every start
+VALIDATED_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "muscle5_validated.json")
+
+def _validated_key(executable_path, st):
+    return f"{os.path.abspath(executable_path)}|{st.st_mtime_ns}|{st.st_size}"
+
+def _load_validated():
+    try:
+        with open(VALIDATED_CACHE_FILE, "r") as f:
+            return set(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return set()
+
+def is_known_good_muscle(executable_path, st):
+    """
+    Check whether this exact binary passed validation in an earlier run
+    
+    Args:
+        executable_path: Path to the MUSCLE5 executable
+        st: os.stat() result for the path
+        
+    Returns:
+        True if the path, mtime and size match a previously validated binary
+    """
+    return _validated_key(executable_path, st) in _load_validated()
+
+def remember_good_muscle(executable_path, st):
+    """
+    Record a successfully validated binary for later runs
+    
+    Args:
+        executable_path: Path to the MUSCLE5 executable
+        st: os.stat() result for the path
+    """
+    validated = _load_validated()
+    validated.add(_validated_key(executable_path, st))
+    try:
+        os.makedirs(os.path.dirname(VALIDATED_CACHE_FILE), exist_ok=True)
+        with open(VALIDATED_CACHE_FILE, "w") as f:
+            json.dump(sorted(validated), f)
+    except OSError:
+        pass  # The cache is only an optimization
+
 def validate_muscle_executable(executable_path):
     """
     Validates that the provided path is a valid MUSCLE5 executable
@@ -73,26 +131,43 @@ def validate_muscle_executable(executable_path):
     Returns:
         Tuple of (is_valid, message)
     """
-    if not os.path.exists(executable_path):
+    try:
+        st = os.stat(executable_path)
+    except OSError:
         return False, f"File does not exist: {executable_path}"
     
+    cache_key = (executable_path, st.st_mtime_ns, st.st_size)
+    cached = _VALIDATE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     if not os.access(executable_path, os.X_OK) and not executable_path.endswith('.exe'):
         return False, f"File is not executable: {executable_path}"
     
+    # A binary validated in an earlier run doesn't need another probe
+    if is_known_good_muscle(executable_path, st):
+        result = True, f"Valid MUSCLE executable detected: {os.path.basename(executable_path)}"
+        _VALIDATE_CACHE[cache_key] = result
+        return result
+    
     try:
         # Try running with -version to see if it's actually MUSCLE
         process = subprocess.run(
             [executable_path, "-version"], 
             capture_output=True, 
-            text=True,
+            stdin=subprocess.DEVNULL,
             check=False,
             timeout=3  # Add a timeout to avoid hanging
         )
         
         # Check for common MUSCLE version strings in output
         output = process.stdout + process.stderr
-        if "MUSCLE" in output or "muscle" in output:
-            return True, f"Valid MUSCLE executable detected: {os.path.basename(executable_path)}"
+        if b"MUSCLE" in output or b"muscle" in output:
+            result = True, f"Valid MUSCLE executable detected: {os.path.basename(executable_path)}"
+            # Failures are not cached so that e.g. a later chmod +x is picked up
+            _VALIDATE_CACHE[cache_key] = result
+            remember_good_muscle(executable_path, st)
+            return result
         else:
             return False, f"File does not appear to be a MUSCLE executable: {executable_path}"
     
@@ -113,6 +188,55 @@ def save_muscle_path(path):
         config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "muscle_config.txt")
         with open(config_path, "w") as f:
             f.write(path)
+        get_configured_muscle_path.cache_clear()
         return True
-    except:
+    except OSError:
         return False
+
+def run_muscle_setup():
+    """
+    Run setup_muscle.py to download and configure MUSCLE5
+    
+    Returns:
+        Path to the configured MUSCLE5 executable, or None if setup failed
+    """
+    print("MUSCLE5 executable not found or invalid. Attempting auto-setup...")
+    try:
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        setup_script = os.path.join(root_dir, "setup_muscle.py")
+        if not os.path.exists(setup_script):
+            return None
+        subprocess.run([sys.executable, setup_script], check=True)
+        get_configured_muscle_path.cache_clear()
+        
+        # Reload path from config after setup
+        config_path = os.path.join(root_dir, "muscle_config.txt")
+        with open(config_path, "r") as f:
+            muscle_path = f.read().strip()
+        if muscle_path and os.path.exists(muscle_path):
+            return muscle_path
+        return None
+    except Exception as e:
+        print(f"Auto-setup failed: {str(e)}")
+        return None
+
+def check_and_setup_muscle(muscle_path=None):
+    """
+    Check if MUSCLE5 needs to be setup and run the setup script if needed
+    
+    This module doesn't import Gradio, so launchers can use it for their
+    pre-flight check without loading the whole application.
+    
+    Args:
+        muscle_path: Path to check, defaults to the configured path
+    
+    Returns:
+        Path to a usable MUSCLE5 executable, or None if setup failed
+    """
+    if muscle_path is None:
+        muscle_path = get_configured_muscle_path()
+    
+    is_valid, _ = validate_muscle_executable(muscle_path)
+    if is_valid:
+        return muscle_path
+    return run_muscle_setup()
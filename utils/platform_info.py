@@ -0,0 +1,13 @@
+"""Interpreter and operating system details, looked up once per process."""
+
+import sys
+import platform
+
+# Built from sys.version_info, which is a plain attribute lookup
+PY_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+# platform.uname() gathers the system, release and machine in one go
+_uname = platform.uname()
+OS_NAME = _uname.system
+OS_RELEASE = _uname.release
+MACHINE = _uname.machine
@@ -0,0 +1,22 @@
+"""Helpers for handing control over to another Python script."""
+
+import os
+import sys
+import subprocess
+
+def exec_script(script):
+    """Replace the current process with ``python <script>``.
+    
+    On POSIX this uses os.execv so no idle parent interpreter stays resident
+    while the app runs. Windows has no true exec, so it falls back to a child
+    process there.
+    
+    Args:
+        script: Path of the Python script to run
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.name == "nt":
+        subprocess.run([sys.executable, script])
+    else:
+        os.execv(sys.executable, [sys.executable, script])
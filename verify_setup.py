@@ -8,19 +8,20 @@ import os
 import sys
 import platform
 import subprocess
-import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 def check_mark(condition):
     """Return a check mark or X based on condition"""
     return "✅" if condition else "❌"
 
+# Import names of packages whose distribution name differs
+PACKAGE_MODULES = {"biopython": "Bio"}
+
 def check_package(package_name):
-    """Check if a Python package is installed"""
-    try:
-        importlib.import_module(package_name)
-        return True
-    except ImportError:
-        return False
+    """Check if a Python package is installed, without importing it"""
+    module_name = PACKAGE_MODULES.get(package_name, package_name)
+    return importlib.util.find_spec(module_name) is not None
 
 def check_muscle():
     """Check if MUSCLE5 is installed and accessible"""
@@ -53,14 +54,17 @@ def main():
     python_ok = sys.version_info.major == 3 and sys.version_info.minor >= 8
     print(f"{check_mark(python_ok)} Python version: {python_version}")
     
-    # 2. Check required packages
+    # 2. Check required packages while the MUSCLE5 probe runs alongside
     packages = ["gradio", "numpy", "biopython"]
+    with ThreadPoolExecutor(max_workers=len(packages) + 1) as pool:
+        muscle_future = pool.submit(check_muscle)
+        package_results = dict(zip(packages, pool.map(check_package, packages)))
+        muscle_ok, muscle_path = muscle_future.result()
+    
     for package in packages:
-        has_package = check_package(package)
-        print(f"{check_mark(has_package)} {package} package")
+        print(f"{check_mark(package_results[package])} {package} package")
     
     # 3. Check MUSCLE5
-    muscle_ok, muscle_path = check_muscle()
     print(f"{check_mark(muscle_ok)} MUSCLE5 executable", end="")
     if muscle_path:
         print(f": {muscle_path}")
@@ -72,7 +76,7 @@ def main():
     print(f"{check_mark(True)} Running in Codespaces: {'Yes' if in_codespaces else 'No'}")
     
     # Summary
-    all_ok = python_ok and all(check_package(pkg) for pkg in packages) and muscle_ok
+    all_ok = python_ok and all(package_results.values()) and muscle_ok
     print("\n" + "=" * 60)
     
     if all_ok: